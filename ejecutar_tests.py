@@ -2,69 +2,259 @@
 """
 Script para ejecutar tests de forma fácil
 """
+import importlib
+import importlib.machinery
+import importlib.util
+import io
+import multiprocessing
 import os
 import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 
-# Agregar directorios al path
+# Agregar directorios al path (sin duplicarlos si el script se importa de nuevo,
+# por ejemplo desde los procesos hijos). src va al final: src/automata.py se llama
+# igual que el paquete de automata-lib y no debe taparlo
 project_root = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, os.path.join(project_root, 'src'))
-sys.path.insert(0, os.path.join(project_root, 'tests'))
+src_path = os.path.join(project_root, 'src')
+tests_path = os.path.join(project_root, 'tests')
+if tests_path not in sys.path:
+    sys.path.insert(0, tests_path)
+if src_path not in sys.path:
+    sys.path.append(src_path)
 
-def main():
-    """Función principal para ejecutar tests"""
-    print("🚀 Ejecutando tests del proyecto AFD Minimizer")
-    print("=" * 60)
-    
-    # Verificar si estamos usando el entorno virtual
-    python_executable = sys.executable
-    if '.venv' not in python_executable:
-        print("⚠️ No estás usando el entorno virtual.")
-        print("   Ejecuta con: .venv/bin/python ejecutar_tests.py")
-        print("   O activa el entorno: source .venv/bin/activate")
-    
-    # Ejecutar tests básicos
-    print("\n📋 EJECUTANDO TESTS BÁSICOS...")
-    from test_afd import ejecutar_tests
-    tests_basicos_ok = ejecutar_tests()
-    
-    # Ejecutar tests comparativos si está disponible automata-lib
-    print("\n🔬 EJECUTANDO TESTS COMPARATIVOS...")
-    try:
-        from test_comparativo import ejecutar_tests_comparativos
-        tests_comparativos_ok = ejecutar_tests_comparativos()
-    except ImportError as e:
-        print(f"⚠️ Tests comparativos no disponibles: {e}")
-        print("   Instala automata-lib con: pip install automata-lib")
-        tests_comparativos_ok = True  # No fallar por esto
+# Textos fijos de la salida
+SEPARADOR = "=" * 60
+TITULO_RESUMEN = "🎯 RESUMEN FINAL ".ljust(60, "=")
+AVISO_SIN_VENV = (
+    "⚠️ No estás usando el entorno virtual.\n"
+    "   Ejecuta con: .venv/bin/python ejecutar_tests.py\n"
+    "   O activa el entorno: source .venv/bin/activate"
+)
+
+# Módulo de los tests comparativos con automata-lib; el resto de tests/test_*.py son básicos
+MODULO_COMPARATIVO = 'test_comparativo'
+
+
+def _modulos_de_tests():
+    """
+    Nombres de los módulos de tests (tests/test_*.py), en orden alfabético: la misma
+    lista se usa con pytest y con los procesos hijos
+    """
+    return sorted(nombre[:-3] for nombre in os.listdir(tests_path)
+                  if nombre.startswith('test_') and nombre.endswith('.py'))
+
+
+def _capturar_salida(modulo, funcion):
+    """
+    Importa y ejecuta una función de tests capturando toda su salida
     
-    # Resumen final
-    print("\n" + "🎯 RESUMEN FINAL ".ljust(60, "="))
+    Returns:
+        Tupla (exito, salida)
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer), redirect_stderr(buffer):
+        exito = getattr(importlib.import_module(modulo), funcion)()
+    return exito, buffer.getvalue()
+
+
+def _run_modulo(modulo):
+    """
+    Ejecuta con unittest los tests de un módulo básico en el proceso hijo
+
+    Returns:
+        Tupla (exito, salida)
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer), redirect_stderr(buffer):
+        print(f"🧪 {modulo}")
+        suite = unittest.defaultTestLoader.loadTestsFromName(modulo)
+        exito = unittest.TextTestRunner(verbosity=2).run(suite).wasSuccessful()
+    return exito, buffer.getvalue()
+
+
+def _run_comparativos():
+    """Ejecuta los tests comparativos en el proceso hijo"""
+    return _capturar_salida('test_comparativo', 'ejecutar_tests_comparativos')
+
+
+def _automata_lib_disponible():
+    """Comprueba si automata-lib está instalada, sin llegar a importarla"""
+    # src/automata.py se llama igual que el paquete: se excluye de la búsqueda
+    rutas = [p for p in sys.path if os.path.abspath(p or os.curdir) != src_path]
+    spec = importlib.machinery.PathFinder.find_spec('automata', rutas)
+    return spec is not None and spec.submodule_search_locations is not None
+
+
+def _contexto_procesos():
+    """Contexto de multiprocessing: forkserver en Linux para lanzar hijos baratos"""
+    if sys.platform.startswith('linux'):
+        return multiprocessing.get_context('forkserver')
+    return None
+
+
+def _pytest_xdist_disponible():
+    """Comprueba si pytest y pytest-xdist están instalados"""
+    return all(importlib.util.find_spec(nombre) is not None for nombre in ('pytest', 'xdist'))
+
+
+class _ResultadosPorArchivo:
+    """Plugin de pytest que cuenta los tests pasados, fallados y salteados de cada archivo"""
+
+    def __init__(self):
+        self.resultados = {}
+
+    def pytest_runtest_logreport(self, report):
+        archivo = os.path.basename(report.nodeid.split("::")[0])
+        cuentas = self.resultados.setdefault(archivo, {"passed": 0, "failed": 0, "skipped": 0})
+        if report.failed:
+            cuentas["failed"] += 1
+        elif report.skipped:
+            cuentas["skipped"] += 1
+        elif report.when == "call":
+            cuentas["passed"] += 1
+
+
+def _ejecutar_con_pytest():
+    """
+    Ejecuta toda la suite con pytest en este mismo intérprete, repartida
+    entre workers de xdist (cada archivo de tests queda en un solo worker)
+
+    Returns:
+        Tupla (tests_basicos_ok, tests_comparativos_ok); tests_comparativos_ok es
+        None si ningún test comparativo llegó a ejecutarse (todos salteados)
+    """
+    import pytest
+
+    plugin = _ResultadosPorArchivo()
+    workers = max(1, (os.cpu_count() or 1) - 2)
+    rutas = [os.path.join(tests_path, f"{modulo}.py") for modulo in _modulos_de_tests()]
+    codigo = pytest.main(["-n", str(workers), "--dist=loadfile", "--no-header", *rutas],
+                         plugins=[plugin])
+
+    comparativos = plugin.resultados.pop(f"{MODULO_COMPARATIVO}.py", {"passed": 0, "failed": 0})
+    if comparativos["failed"]:
+        tests_comparativos_ok = False
+    elif comparativos["passed"]:
+        tests_comparativos_ok = True
+    else:
+        tests_comparativos_ok = None
+
+    # Un error de colección o de pytest no deja resultados por archivo: cuenta como fallo
+    tests_basicos_ok = (codigo in (pytest.ExitCode.OK, pytest.ExitCode.TESTS_FAILED)
+                        and not any(cuentas["failed"] for cuentas in plugin.resultados.values()))
+    return tests_basicos_ok, tests_comparativos_ok
+
+
+def _volcar(salida):
+    """Escribe en stdout la salida acumulada y vacía el buffer"""
+    sys.stdout.write(salida.getvalue())
+    sys.stdout.flush()
+    salida.seek(0)
+    salida.truncate()
+
+
+def _imprimir_resumen(salida, tests_basicos_ok, tests_comparativos_ok):
+    """
+    Escribe el resumen final de las dos suites
+
+    Args:
+        salida: Buffer donde se acumula la salida
+        tests_basicos_ok: Si pasaron los tests básicos
+        tests_comparativos_ok: Si pasaron los comparativos (None si no se ejecutaron)
+
+    Returns:
+        True si no falló ninguna suite
+    """
+    print("\n" + TITULO_RESUMEN, file=salida)
     if tests_basicos_ok:
-        print("✅ Tests básicos: PASARON")
+        print("✅ Tests básicos: PASARON", file=salida)
     else:
-        print("❌ Tests básicos: FALLARON")
+        print("❌ Tests básicos: FALLARON", file=salida)
     
-    if 'tests_comparativos_ok' in locals():
-        if tests_comparativos_ok:
-            print("✅ Tests comparativos: PASARON")
-            print("   🎉 Tu implementación coincide con automata-lib!")
-        else:
-            print("❌ Tests comparativos: FALLARON")
+    if tests_comparativos_ok is None:
+        print("⚠️ Tests comparativos: NO EJECUTADOS", file=salida)
+    elif tests_comparativos_ok:
+        print("✅ Tests comparativos: PASARON", file=salida)
+        print("   🎉 Tu implementación coincide con automata-lib!", file=salida)
     else:
-        print("⚠️ Tests comparativos: NO EJECUTADOS")
+        print("❌ Tests comparativos: FALLARON", file=salida)
     
-    exito_general = tests_basicos_ok and (not 'tests_comparativos_ok' in locals() or tests_comparativos_ok)
+    # Los comparativos no ejecutados no cuentan como fallo
+    exito_general = tests_basicos_ok and (tests_comparativos_ok is None or tests_comparativos_ok)
     
     if exito_general:
-        print("\n🎉 ¡TODOS LOS TESTS COMPLETADOS EXITOSAMENTE!")
-        print("   Tu implementación AFD está funcionando correctamente")
-        print("   ✅ Verificada contra la librería estándar automata-lib")
+        print("\n🎉 ¡TODOS LOS TESTS COMPLETADOS EXITOSAMENTE!", file=salida)
+        print("   Tu implementación AFD está funcionando correctamente", file=salida)
+        print("   ✅ Verificada contra la librería estándar automata-lib", file=salida)
     else:
-        print("\n❌ ALGUNOS TESTS FALLARON")
-        print("   Revisa los errores reportados arriba")
+        print("\n❌ ALGUNOS TESTS FALLARON", file=salida)
+        print("   Revisa los errores reportados arriba", file=salida)
+    _volcar(salida)
     
     return exito_general
 
+
+def main():
+    """Función principal para ejecutar tests"""
+    # La salida se acumula y se vuelca de una vez al final de cada fase
+    salida = io.StringIO()
+    print("🚀 Ejecutando tests del proyecto AFD Minimizer", file=salida)
+    print(SEPARADOR, file=salida)
+    
+    # Verificar si estamos usando un entorno virtual (en un venv, sys.prefix
+    # apunta al entorno y sys.base_prefix a la instalación base)
+    if sys.prefix == sys.base_prefix:
+        print(AVISO_SIN_VENV, file=salida)
+    
+    # Con pytest-xdist instalado se delega todo en pytest; si no, se usan
+    # los ejecutores propios de cada suite en procesos hijos
+    if _pytest_xdist_disponible():
+        _volcar(salida)
+        tests_basicos_ok, tests_comparativos_ok = _ejecutar_con_pytest()
+        return _imprimir_resumen(salida, tests_basicos_ok, tests_comparativos_ok)
+    
+    # Los comparativos solo se lanzan si automata-lib está instalada
+    comparativos_disponibles = _automata_lib_disponible()
+    
+    # None indica que los tests comparativos no se ejecutaron
+    tests_comparativos_ok = None
+    
+    # Los mismos módulos que recibe pytest: los básicos son todos menos el comparativo
+    modulos_basicos = [modulo for modulo in _modulos_de_tests() if modulo != MODULO_COMPARATIVO]
+    
+    # Los módulos son independientes: se ejecutan a la vez en procesos hijos
+    # (los imports ocurren en cada hijo) y la salida se muestra en orden
+    with ProcessPoolExecutor(max_workers=len(modulos_basicos) + 1, mp_context=_contexto_procesos()) as ex:
+        futuros_basicos = [ex.submit(_run_modulo, modulo) for modulo in modulos_basicos]
+        futuro_comparativos = ex.submit(_run_comparativos) if comparativos_disponibles else None
+        
+        # Ejecutar tests básicos
+        print("\n📋 EJECUTANDO TESTS BÁSICOS...", file=salida)
+        tests_basicos_ok = True
+        for futuro in futuros_basicos:
+            exito, salida_suite = futuro.result()
+            tests_basicos_ok = tests_basicos_ok and exito
+            print(salida_suite, end="", file=salida)
+            _volcar(salida)
+        
+        # Ejecutar tests comparativos si está disponible automata-lib
+        print("\n🔬 EJECUTANDO TESTS COMPARATIVOS...", file=salida)
+        if futuro_comparativos is None:
+            print("⚠️ Tests comparativos no disponibles: automata-lib no está instalada", file=salida)
+            print("   Instala automata-lib con: pip install automata-lib", file=salida)
+        else:
+            try:
+                tests_comparativos_ok, salida_suite = futuro_comparativos.result()
+                print(salida_suite, end="", file=salida)
+            except ImportError as e:
+                print(f"⚠️ Tests comparativos no disponibles: {e}", file=salida)
+                print("   Instala automata-lib con: pip install automata-lib", file=salida)
+        _volcar(salida)
+    
+    return _imprimir_resumen(salida, tests_basicos_ok, tests_comparativos_ok)
+
 if __name__ == "__main__":
     # Ejecutar tests
     exitoso = main()
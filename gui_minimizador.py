@@ -5,11 +5,20 @@ GUI Mejorada para el Minimizador de Autómatas usando Tkinter
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
-from typing import Optional, Union, Dict, Any
-import pydot
-from PIL import Image, ImageTk
+from typing import TYPE_CHECKING, Optional, Union, Deque, Dict, Any, List, Tuple
+import functools
+import hashlib
 import io
-import json
+import itertools
+import logging
+import math
+import queue
+import shutil
+import subprocess
+import tempfile
+import time
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 import sys
 import os
@@ -18,15 +27,275 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 # Importar las clases del sistema (desde src/)
 from automata import Automata
+from manejador_archivos import ManejadorArchivos
 from afd import AFD
 from afnd import AFND
 
+log = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from PIL import Image, ImageTk
+
+# PIL se importa recién cuando hace falta, así la ventana aparece antes
+_modulos_pil = None
+_modulo_cairosvg = None  # False si no está instalado
+_fuente_prueba = None  # (fuente, mitad de la altura de una línea)
+
+
+def _pil():
+    """Importar PIL la primera vez que se usa y devolver (Image, ImageTk)"""
+    global _modulos_pil
+    if _modulos_pil is None:
+        from PIL import Image, ImageTk
+        _modulos_pil = (Image, ImageTk)
+    return _modulos_pil
+
+
+# Atributos generales del grafo y estilos por defecto de nodos y aristas
+_ENCABEZADO_DOT = (
+    'digraph G {\n'
+    'rankdir=LR; bgcolor=white; size="8,6"; ratio=compress;\n'
+    'fontname=Arial; fontsize=11; ranksep=0.5; nodesep=0.4;\n'
+    'node [fontname=Arial, fontsize=10, style=filled, fillcolor=lightblue, penwidth=2];\n'
+    'edge [fontname=Arial, fontsize=9, arrowsize=0.8];'
+)
+_ESTILO_LOOP = 'color="#4169E1", fontcolor="#4169E1", penwidth=1.5'
+_ESTILO_ARISTA = 'color="#696969", fontcolor=black, penwidth=1.5'
+
+
+def _id_dot(texto: Any) -> str:
+    """Convertir un nombre de estado o etiqueta en un identificador DOT entre comillas"""
+    return '"' + str(texto).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _fuente():
+    """
+    Fuente por defecto de PIL para la imagen de prueba, cargada una sola vez
+
+    Returns:
+        Tupla (fuente, mitad de la altura de una línea), para centrar texto a mano
+        sin que PIL mida cada cadena con anchor='mm'
+    """
+    global _fuente_prueba
+    if _fuente_prueba is None:
+        from PIL import ImageFont
+        fuente = ImageFont.load_default()
+        _, arriba, _, abajo = fuente.getbbox("Ag")
+        _fuente_prueba = (fuente, (arriba + abajo) / 2)
+    return _fuente_prueba
+
+
+def _clave_contenido(automata: Union[AFD, AFND]) -> tuple:
+    """
+    Clave que identifica a un autómata por su contenido (dos autómatas iguales
+    generan el mismo gráfico aunque sean objetos distintos)
+    """
+    transiciones = frozenset(
+        (clave, destino if isinstance(destino, str) else frozenset(destino))
+        for clave, destino in automata.transiciones.items()
+    )
+    return (automata.KIND, frozenset(automata.estados), frozenset(automata.alfabeto),
+            frozenset(automata.estados_finales), automata.estado_inicial, transiciones)
+
+
+def _construir_piramide(imagen: "Image.Image", lado_minimo: int = 64) -> "List[Image.Image]":
+    """
+    Construir la pirámide [imagen, 1/2, 1/4, ...] hasta que el lado menor llegue a lado_minimo
+
+    Args:
+        imagen: Imagen original (nivel 0)
+        lado_minimo: Tamaño a partir del cual no se reduce más
+
+    Returns:
+        Lista de niveles, cada uno la mitad del anterior
+    """
+    niveles = [imagen]
+    while min(niveles[-1].size) > lado_minimo:
+        niveles.append(niveles[-1].reduce(2))
+    return niveles
+
+
+def _renderizar_dot(fuente: str, formato: str, programa: str = 'dot') -> bytes:
+    """
+    Renderizar código DOT con el ejecutable de Graphviz, por tuberías (sin archivos temporales)
+
+    Args:
+        fuente: Código DOT del grafo
+        formato: Formato de salida de Graphviz ('png', 'svg', ...)
+        programa: Motor de layout de Graphviz ('dot', 'sfdp', ...)
+
+    Returns:
+        Bytes de la imagen generada
+
+    Raises:
+        FileNotFoundError: Si el ejecutable 'dot' no está en el PATH
+        subprocess.CalledProcessError: Si Graphviz devuelve un error
+    """
+    resultado = subprocess.run(['dot', f'-K{programa}', f'-T{formato}'], input=fuente.encode('utf-8'),
+                               capture_output=True, check=True)
+    return resultado.stdout
+
+
+# Tamaño máximo del caché en disco de gráficos; al superarlo se borran los menos usados
+TAMANO_MAXIMO_CACHE_GRAFICOS = 64 * 1024 * 1024
+
+
+def _directorio_cache_graficos() -> str:
+    """Directorio del caché en disco de gráficos renderizados (~/.cache/afd-minimizer)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'afd-minimizer')
+
+
+def _renderizar_dot_cacheado(fuente: str, formato: str, programa: str = 'dot',
+                             directorio: Optional[str] = None) -> bytes:
+    """
+    Renderizar código DOT reutilizando el resultado guardado en disco por una ejecución anterior
+
+    El archivo se identifica por un hash del código DOT, del motor y del formato: el código
+    DOT describe por completo al gráfico, así que el mismo autómata siempre cae en el mismo
+    archivo y cualquier cambio (o un cambio de estilo en el programa) en uno nuevo.
+    Los errores de lectura o escritura del caché se ignoran y solo cuesta volver a renderizar.
+    Leer un archivo actualiza su fecha de modificación, y después de cada escritura se
+    borran los archivos usados hace más tiempo hasta que el caché entra en
+    TAMANO_MAXIMO_CACHE_GRAFICOS (ver _podar_cache_graficos).
+
+    Args:
+        fuente: Código DOT del grafo
+        formato: Formato de salida de Graphviz ('png', 'svg', ...)
+        programa: Motor de layout de Graphviz ('dot', 'sfdp', ...)
+        directorio: Directorio del caché (por defecto ~/.cache/afd-minimizer)
+
+    Returns:
+        Bytes de la imagen generada
+    """
+    directorio = directorio or _directorio_cache_graficos()
+    huella = hashlib.blake2b(f'{programa}\n{formato}\n{fuente}'.encode('utf-8'), digest_size=16).hexdigest()
+    ruta = os.path.join(directorio, f'{huella}.{formato}')
+    try:
+        with open(ruta, 'rb') as archivo:
+            datos = archivo.read()
+        os.utime(ruta)  # marcar como usado recién: la poda borra primero los más viejos
+        return datos
+    except OSError:
+        pass
+
+    datos = _renderizar_dot(fuente, formato, programa)
+    try:
+        # Escribir en un temporal propio y renombrar: ni otra instancia ni otro hilo de
+        # renderizado leen o reemplazan un archivo a medias
+        os.makedirs(directorio, exist_ok=True)
+        descriptor, temporal = tempfile.mkstemp(suffix='.tmp', dir=directorio)
+        try:
+            with os.fdopen(descriptor, 'wb') as archivo:
+                archivo.write(datos)
+            os.replace(temporal, ruta)
+        except OSError:
+            os.remove(temporal)
+            raise
+        _podar_cache_graficos(directorio, TAMANO_MAXIMO_CACHE_GRAFICOS)
+    except OSError as e:
+        log.debug("No se pudo guardar el gráfico en el caché: %s", e)
+    return datos
+
+
+def _podar_cache_graficos(directorio: str, tamano_maximo: int) -> None:
+    """
+    Borrar los gráficos usados hace más tiempo hasta que el caché no supere tamano_maximo
+
+    Los temporales que quedaron de escrituras interrumpidas se borran si tienen más de una hora.
+
+    Args:
+        directorio: Directorio del caché
+        tamano_maximo: Tamaño total permitido en bytes
+    """
+    archivos = []
+    total = 0
+    limite_temporales = time.time() - 3600
+    with os.scandir(directorio) as entradas:
+        for entrada in entradas:
+            try:
+                datos = entrada.stat()
+            except OSError:
+                continue  # borrado por otra instancia
+            if entrada.name.endswith('.tmp'):
+                if datos.st_mtime < limite_temporales:
+                    try:
+                        os.remove(entrada.path)
+                    except OSError:
+                        pass
+                continue
+            archivos.append((datos.st_mtime, datos.st_size, entrada.path))
+            total += datos.st_size
+    
+    if total <= tamano_maximo:
+        return
+    archivos.sort()
+    for _, tamano, ruta in archivos:
+        try:
+            os.remove(ruta)
+        except OSError:
+            pass
+        total -= tamano
+        if total <= tamano_maximo:
+            break
+
+
+def _cairosvg():
+    """
+    Importar cairosvg (opcional) la primera vez que se usa
+
+    Returns:
+        El módulo cairosvg, o None si no está instalado
+    """
+    global _modulo_cairosvg
+    if _modulo_cairosvg is None:
+        try:
+            import cairosvg
+            _modulo_cairosvg = cairosvg
+        except (ImportError, OSError):
+            # OSError: cairosvg instalado pero sin la biblioteca nativa de Cairo
+            _modulo_cairosvg = False
+    return _modulo_cairosvg or None
+
+
+def _memoria_imagen(imagen: "Image.Image") -> int:
+    """Bytes que ocupan los píxeles de una imagen PIL"""
+    return imagen.width * imagen.height * len(imagen.getbands())
+
+
+class _EntradaGrafico:
+    """
+    Imagen de un autómata en el caché de gráficos junto con todo lo que se deriva de ella
+
+    Attributes:
+        imagen: Imagen RGB generada por Graphviz
+        niveles: Pirámide [imagen, 1/2, 1/4, ...]; los niveles que faltan se agregan cuando
+                 el zoom los necesita
+        zooms: Versiones ya redimensionadas con calidad final: (ancho, alto) -> imagen
+        foto_base: PhotoImage de la imagen sin zoom, para las ampliaciones enteras de Tk
+        memoria: Bytes que ocupan la imagen y sus derivadas (la PhotoImage, aproximado)
+    """
+
+    def __init__(self, imagen: "Image.Image", niveles: "List[Image.Image]"):
+        self.imagen = imagen
+        self.niveles = niveles
+        self.zooms: "OrderedDict[Tuple[int, int], Image.Image]" = OrderedDict()
+        self.foto_base: "Optional[ImageTk.PhotoImage]" = None
+        self.memoria = sum(_memoria_imagen(nivel) for nivel in niveles)
+
 
 class GUIMinimizador:
     """
     Interfaz gráfica mejorada para el minimizador de autómatas
     """
 
+    # Nombre de cada panel para los mensajes
+    NOMBRES_PANEL = {'original': 'original', 'afd': 'AFD', 'minimizado': 'minimizado'}
+
+    # Durante la interacción, un zoom a menos de esta distancia de n o de 1/n se redondea
+    # para que Tk lo aplique directamente (ver _factor_tk)
+    TOLERANCIA_ZOOM_TK = 0.05
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("🤖 Minimizador de Autómatas - Fundamentos Teóricos de Informática")
@@ -45,14 +314,67 @@ class GUIMinimizador:
         self.automata_minimizado: Optional[AFD] = None
         self.afd_original_para_min: Optional[AFD] = None
         self.lenguaje: str = "No especificado"
-        self.imagen_original: Optional[ImageTk.PhotoImage] = None
-        self.imagen_afd: Optional[ImageTk.PhotoImage] = None
-        self.imagen_minimizado: Optional[ImageTk.PhotoImage] = None
+        # Resultados de validar_automata por autómata: id(automata) -> (automata, resultado). Se
+        # calculan al cargar y se reutilizan en el informe; se guarda también el autómata para que
+        # su id no pueda reutilizarse mientras esté en caché
+        self._validaciones: Dict[int, Tuple[Union[AFD, AFND], Dict[str, Any]]] = {}
+        # Resultados de _probar_cadena por cadena; se vacía cuando cambia algún autómata
+        self._aceptacion_cacheada = functools.lru_cache(maxsize=1024)(self._procesar_en_paneles)
+        self.imagen_original: "Optional[ImageTk.PhotoImage]" = None
+        self.imagen_afd: "Optional[ImageTk.PhotoImage]" = None
+        self.imagen_minimizado: "Optional[ImageTk.PhotoImage]" = None
+
+        # PhotoImage actual de cada panel: si el tamaño no cambia se reutiliza con paste()
+        # en lugar de crear un objeto de imagen de Tk nuevo en cada redibujado
+        self._tk_images: "Dict[str, ImageTk.PhotoImage]" = {}
+        # Qué muestra cada PhotoImage: panel -> (imagen PIL original, (ancho, alto, calidad_final,
+        # ventana)). ventana es el rectángulo (izquierda, arriba, derecha, abajo) de la imagen
+        # ampliada que contiene la PhotoImage: toda la imagen, salvo con zoom muy grande
+        self._vista_actual: "Dict[str, Tuple[Image.Image, Tuple[int, int, bool, Tuple[int, int, int, int]]]]" = {}
+        # Ítem de imagen de cada canvas, reutilizado entre redibujados
+        self._canvas_image_ids: Dict[str, int] = {}
+        # Ítem de texto del placeholder de cada canvas (clave: nombre del widget)
+        self._placeholder_ids: Dict[str, int] = {}
 
         # Variables para almacenar imágenes originales (sin zoom)
-        self.imagen_original_pil: Optional[Image.Image] = None
-        self.imagen_afd_pil: Optional[Image.Image] = None
-        self.imagen_minimizado_pil: Optional[Image.Image] = None
+        self.imagen_original_pil: "Optional[Image.Image]" = None
+        self.imagen_afd_pil: "Optional[Image.Image]" = None
+        self.imagen_minimizado_pil: "Optional[Image.Image]" = None
+
+        # Caché LRU de gráficos por contenido: _clave_contenido(automata) -> _EntradaGrafico, con
+        # la imagen y sus derivadas (pirámide, versiones por zoom, PhotoImage base), que se
+        # descartan juntas. Sobrevive a la carga de archivos, así recargar o reprocesar un
+        # autómata igual no vuelve a invocar Graphviz. Ocupa como máximo memoria_maxima_graficos
+        # bytes, sin contar los gráficos que se están mostrando (esos nunca se descartan)
+        self._graficos: "OrderedDict[tuple, _EntradaGrafico]" = OrderedDict()
+        # Índice de la misma caché por imagen: id(imagen) -> entrada (se actualiza junto con _graficos)
+        self._graficos_por_imagen: "Dict[int, _EntradaGrafico]" = {}
+        self.memoria_maxima_graficos = 256 * 1024 * 1024
+        self._memoria_graficos = 0
+
+        # Renderizado en segundo plano: un pool con un hilo por panel, así los tres gráficos
+        # pueden generarse a la vez. Los hilos dejan (panel, automata, imagen, niveles, error) en la
+        # cola y el hilo de Tk la vacía periódicamente con after()
+        self._render_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="render")
+        self._cola_render: queue.Queue = queue.Queue()
+        self._renders_en_curso: Dict[int, Union[AFD, AFND]] = {}
+        self._drenado_after_id = None
+        # Resultado de procesar cuyo gráfico se está generando: mientras tanto "Procesar" queda
+        # deshabilitado, para no lanzar otra operación encima de la anterior
+        self._procesando_grafico: Optional[AFD] = None
+        # Si el ejecutable 'dot' está disponible; se averigua en el primer gráfico
+        self._graphviz_ok: Optional[bool] = None
+        # A partir de esta cantidad de estados se usa sfdp (layout por fuerzas, mucho más rápido
+        # que el jerárquico de dot en grafos grandes) en lugar de dot
+        self.umbral_sfdp = 50
+        # Sin cairosvg los gráficos se renderizan a escala_render veces 96 dpi: con zoom 1 se
+        # muestran reducidos y al ampliar hay detalle real hasta ese factor, en lugar de remuestrear
+        # una imagen chica. Con cairosvg se usa 96 dpi (el redibujado final sale del SVG, y el PNG
+        # a escala 2 solo costaría cuatro veces la memoria en cada caché de imágenes)
+        self.escala_render = 2
+        # Versiones redimensionadas que guarda cada entrada de _graficos (al volver a un zoom
+        # ya visitado se reutiliza sin remuestrear)
+        self.tamano_zoom_cache = 16
 
         # Variables de zoom para cada panel
         self.zoom_original = 1.0
@@ -62,11 +384,36 @@ class GUIMinimizador:
         self.zoom_min = 0.1     # Zoom mínimo
         self.zoom_max = 5.0     # Zoom máximo
 
+        # Redibujado pendiente por panel: los eventos de rueda se agrupan en uno por frame
+        self._zoom_after_id = {'original': None, 'afd': None, 'minimizado': None}
+        self.zoom_delay_ms = 16
+
+        # Durante el zoom se redimensiona rápido (NEAREST) y, cuando la rueda se detiene,
+        # se redibuja con calidad final
+        self._calidad_after_id = {'original': None, 'afd': None, 'minimizado': None}
+        self.calidad_delay_ms = 150
+
         # Variables de offset para pan/arrastre
         self.offset_original = {'x': 0, 'y': 0}
         self.offset_afd = {'x': 0, 'y': 0}
         self.offset_minimizado = {'x': 0, 'y': 0}
         self.drag_start = None  # Para drag-and-drop
+        # Redibujado pendiente por panel al arrastrar: los eventos de movimiento que llegan antes
+        # de que Tk quede ocioso se agrupan en un solo redibujado con el último offset
+        self._arrastre_after_id = {'original': None, 'afd': None, 'minimizado': None}
+        # Tamaño de cada canvas, actualizado por <Configure>: los redibujados no consultan a Tk
+        # (350x200 hasta que el canvas se muestra por primera vez)
+        self._tamano_canvas = {'original': (350, 200), 'afd': (350, 200), 'minimizado': (350, 200)}
+        # Si la imagen ampliada supera sobredibujo veces el canvas en algún eje, solo se genera
+        # esa cantidad alrededor de la zona visible (un canvas de margen por lado con 3)
+        self.sobredibujo = 3
+
+        # Mensajes de la consola de estado pendientes de mostrar: se insertan todos juntos como
+        # mucho cada estado_delay_ms, y la consola conserva solo las últimas max_lineas_estado
+        self._cola_estado: Deque[Tuple[str, str]] = deque(maxlen=500)
+        self._estado_after_id = None
+        self.estado_delay_ms = 50
+        self.max_lineas_estado = 1000
 
         # Opción de operación
         self.operacion = tk.StringVar(value="afnd_afd")
@@ -223,13 +570,14 @@ class GUIMinimizador:
         self._mostrar_placeholder(self.canvas_original, "No hay autómata cargado")
         
         # Bindings para zoom en panel original
-        self.canvas_original.bind("<MouseWheel>", lambda e: self._zoom_canvas(e, 'original'))
-        self.canvas_original.bind("<Button-4>", lambda e: self._zoom_canvas(e, 'original', zoom_in=True))
-        self.canvas_original.bind("<Button-5>", lambda e: self._zoom_canvas(e, 'original', zoom_in=False))
+        self.canvas_original.bind("<MouseWheel>", functools.partial(self._zoom_canvas, panel='original'))
+        self.canvas_original.bind("<Configure>", functools.partial(self._canvas_redimensionado, panel='original'))
+        self.canvas_original.bind("<Button-4>", functools.partial(self._zoom_canvas, panel='original', zoom_in=True))
+        self.canvas_original.bind("<Button-5>", functools.partial(self._zoom_canvas, panel='original', zoom_in=False))
 
         # Bindings para drag en panel original
-        self.canvas_original.bind("<ButtonPress-1>", lambda e: self._start_drag(e, 'original'))
-        self.canvas_original.bind("<B1-Motion>", lambda e: self._drag(e, 'original'))
+        self.canvas_original.bind("<ButtonPress-1>", functools.partial(self._start_drag, panel='original'))
+        self.canvas_original.bind("<B1-Motion>", functools.partial(self._drag, panel='original'))
 
         # Panel AFD Convertido
         self.frame_afd = ttk.LabelFrame(
@@ -249,13 +597,14 @@ class GUIMinimizador:
         self._mostrar_placeholder(self.canvas_afd, "No hay conversión")
         
         # Bindings para zoom en panel AFD
-        self.canvas_afd.bind("<MouseWheel>", lambda e: self._zoom_canvas(e, 'afd'))
-        self.canvas_afd.bind("<Button-4>", lambda e: self._zoom_canvas(e, 'afd', zoom_in=True))
-        self.canvas_afd.bind("<Button-5>", lambda e: self._zoom_canvas(e, 'afd', zoom_in=False))
+        self.canvas_afd.bind("<MouseWheel>", functools.partial(self._zoom_canvas, panel='afd'))
+        self.canvas_afd.bind("<Configure>", functools.partial(self._canvas_redimensionado, panel='afd'))
+        self.canvas_afd.bind("<Button-4>", functools.partial(self._zoom_canvas, panel='afd', zoom_in=True))
+        self.canvas_afd.bind("<Button-5>", functools.partial(self._zoom_canvas, panel='afd', zoom_in=False))
 
         # Bindings para drag en panel AFD
-        self.canvas_afd.bind("<ButtonPress-1>", lambda e: self._start_drag(e, 'afd'))
-        self.canvas_afd.bind("<B1-Motion>", lambda e: self._drag(e, 'afd'))
+        self.canvas_afd.bind("<ButtonPress-1>", functools.partial(self._start_drag, panel='afd'))
+        self.canvas_afd.bind("<B1-Motion>", functools.partial(self._drag, panel='afd'))
 
         # Panel AFD Minimizado
         self.frame_minimizado = ttk.LabelFrame(
@@ -275,13 +624,14 @@ class GUIMinimizador:
         self._mostrar_placeholder(self.canvas_minimizado, "No hay minimización")
         
         # Bindings para zoom en panel minimizado
-        self.canvas_minimizado.bind("<MouseWheel>", lambda e: self._zoom_canvas(e, 'minimizado'))
-        self.canvas_minimizado.bind("<Button-4>", lambda e: self._zoom_canvas(e, 'minimizado', zoom_in=True))
-        self.canvas_minimizado.bind("<Button-5>", lambda e: self._zoom_canvas(e, 'minimizado', zoom_in=False))
+        self.canvas_minimizado.bind("<MouseWheel>", functools.partial(self._zoom_canvas, panel='minimizado'))
+        self.canvas_minimizado.bind("<Configure>", functools.partial(self._canvas_redimensionado, panel='minimizado'))
+        self.canvas_minimizado.bind("<Button-4>", functools.partial(self._zoom_canvas, panel='minimizado', zoom_in=True))
+        self.canvas_minimizado.bind("<Button-5>", functools.partial(self._zoom_canvas, panel='minimizado', zoom_in=False))
 
         # Bindings para drag en panel minimizado
-        self.canvas_minimizado.bind("<ButtonPress-1>", lambda e: self._start_drag(e, 'minimizado'))
-        self.canvas_minimizado.bind("<B1-Motion>", lambda e: self._drag(e, 'minimizado'))
+        self.canvas_minimizado.bind("<ButtonPress-1>", functools.partial(self._start_drag, panel='minimizado'))
+        self.canvas_minimizado.bind("<B1-Motion>", functools.partial(self._drag, panel='minimizado'))
 
         # ===== SECCIÓN INFERIOR: Consola de estado =====
         frame_consola = ttk.LabelFrame(main_container, text="📝 Consola de Estado", padding="5")
@@ -295,15 +645,26 @@ class GUIMinimizador:
             font=('Consolas', 9),
             bg='#2c3e50',
             fg='#ecf0f1',
-            insertbackground='white'
+            insertbackground='white',
+            state=tk.DISABLED  # Solo lectura: se habilita al insertar mensajes
         )
         self.texto_estado.pack(fill=tk.BOTH, expand=True)
         
+        # Configurar tags para diferentes tipos de mensajes (una sola vez)
+        self.texto_estado.tag_config('normal', foreground='#ecf0f1')
+        self.texto_estado.tag_config('success', foreground='#2ecc71', font=('Consolas', 9, 'bold'))
+        self.texto_estado.tag_config('error', foreground='#e74c3c', font=('Consolas', 9, 'bold'))
+        self.texto_estado.tag_config('warning', foreground='#f39c12', font=('Consolas', 9, 'bold'))
+        self.texto_estado.tag_config('info', foreground='#3498db', font=('Consolas', 9, 'bold'))
+        self.texto_estado.tag_config('header', foreground='#9b59b6', font=('Consolas', 9, 'bold'))
+        
         # Mensaje de bienvenida
-        self._mostrar_estado("═" * 60 + "\n", 'header')
-        self._mostrar_estado("🤖 Sistema de Minimización de Autómatas iniciado\n", 'success')
-        self._mostrar_estado("═" * 60 + "\n", 'header')
-        self._mostrar_estado("Esperando cargar un autómata...\n", 'info')
+        self._mostrar_estados([
+            ("═" * 60 + "\n", 'header'),
+            ("🤖 Sistema de Minimización de Autómatas iniciado\n", 'success'),
+            ("═" * 60 + "\n", 'header'),
+            ("Esperando cargar un autómata...\n", 'info'),
+        ])
 
     def _configurar_layout(self):
         """Configurar el layout de los widgets"""
@@ -314,15 +675,21 @@ class GUIMinimizador:
 
     def _mostrar_placeholder(self, canvas, texto):
         """Mostrar texto placeholder en un canvas"""
-        canvas.delete("all")
+        # Quitar el gráfico; el ítem de texto del placeholder se crea una vez y se reutiliza
+        canvas.delete("grafico")
+        item = self._placeholder_ids.get(str(canvas))
+        if item is not None and canvas.type(item) == 'text':
+            canvas.itemconfig(item, text=texto, state='normal')
+            return
         width = canvas.winfo_reqwidth()
         height = canvas.winfo_reqheight()
-        canvas.create_text(
+        self._placeholder_ids[str(canvas)] = canvas.create_text(
             width/2, height/2,
             text=texto,
             font=('Segoe UI', 12),
             fill='#7f8c8d',
-            anchor='center'
+            anchor='center',
+            tags=("placeholder",)
         )
 
     def _cargar_archivo(self):
@@ -343,16 +710,15 @@ class GUIMinimizador:
             self.zoom_original = 1.0
             self.imagen_original_pil = None
             
-            # Leer JSON para extraer campo Lenguaje
-            with open(archivo, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Leer el JSON una sola vez: de ahí sale el campo Lenguaje y el autómata
+            data = ManejadorArchivos.leer_json(archivo)
             self.lenguaje = data.get("Lenguaje", "No especificado")
             
             # Cargar autómata
-            self.automata_original = self.automata_manager.cargar(archivo)
+            self.automata_original = self.automata_manager.cargar(archivo, datos=data)
             
             # Validar autómata
-            validacion = self.automata_manager.validar_automata(self.automata_original)
+            validacion = self._validar(self.automata_original)
             
             # Mostrar resultados
             self._mostrar_estado(f"\n📁 Autómata cargado desde: {archivo}\n", 'success')
@@ -360,7 +726,7 @@ class GUIMinimizador:
             
             if validacion["es_valido"]:
                 # Generar gráfico del original
-                self._generar_grafico_original()
+                self._generar_grafico('original')
                 self.btn_procesar.config(state=tk.NORMAL)
                 self.btn_probar.config(state=tk.NORMAL)
                 self._mostrar_estado("✅ Autómata listo para procesar\n", 'success')
@@ -382,6 +748,9 @@ class GUIMinimizador:
         self.automata_original = None
         self.automata_afd = None
         self.automata_minimizado = None
+        self._validaciones.clear()
+        self._procesando_grafico = None
+        self._aceptacion_cacheada.cache_clear()
         self.lenguaje = "No especificado"
         self.label_resultado_prueba.config(text="")
         self.label_lenguaje.config(text="")
@@ -408,6 +777,9 @@ class GUIMinimizador:
             return
 
         try:
+            # Los autómatas resultantes van a cambiar: descartar resultados de pruebas previas
+            self._aceptacion_cacheada.cache_clear()
+            
             op = self.operacion.get()
             self._mostrar_estado(f"\n⚙️ Procesando operación: {'AFND → AFD' if op == 'afnd_afd' else 'AFD → AFD mínimo'}\n", 'info')
             
@@ -437,14 +809,15 @@ class GUIMinimizador:
                 self.zoom_minimizado = 1.0
             
             if op == "afnd_afd":
-                if not isinstance(self.automata_original, AFND):
+                if self.automata_original.KIND != AFND.KIND:
                     self._mostrar_estado("⚠️ El autómata cargado no es un AFND.\n", 'warning')
                     messagebox.showwarning("Advertencia", "El autómata cargado no es un AFND")
                     return
                 
                 # Conversión AFND → AFD
                 self.automata_afd = self.automata_manager.to_afd(self.automata_original)
-                self._generar_grafico_afd()
+                self._generar_grafico('afd')
+                self._esperar_grafico(self.automata_afd)
                 self._mostrar_estado("✅ Conversión AFND → AFD completada exitosamente.\n", 'success')
                 self._mostrar_estadisticas_conversion()
                 
@@ -452,7 +825,7 @@ class GUIMinimizador:
                 # Seleccionar AFD a minimizar: convertido si existe, sino el original
                 afd_a_minimizar = self.automata_afd if self.automata_afd else self.automata_original
                 
-                if not isinstance(afd_a_minimizar, AFD):
+                if afd_a_minimizar.KIND != AFD.KIND:
                     self._mostrar_estado("⚠️ No hay AFD disponible para minimizar.\n", 'warning')
                     messagebox.showwarning("Advertencia", "No hay AFD disponible para minimizar")
                     return
@@ -462,7 +835,8 @@ class GUIMinimizador:
                 
                 # Minimización AFD
                 self.automata_minimizado = self.automata_manager.minimizar(afd_a_minimizar)
-                self._generar_grafico_minimizado()
+                self._generar_grafico('minimizado')
+                self._esperar_grafico(self.automata_minimizado)
                 self._mostrar_estado("✅ Minimización de AFD completada exitosamente.\n", 'success')
                 self._mostrar_estadisticas_minimizacion()
             
@@ -473,15 +847,23 @@ class GUIMinimizador:
             messagebox.showerror("Error", f"Error al procesar autómata:\n{str(e)}")
             self._mostrar_estado(f"❌ Error al procesar: {str(e)}\n", 'error')
 
+    def _esperar_grafico(self, automata: AFD):
+        """Deshabilitar "Procesar" hasta que termine de generarse el gráfico del resultado"""
+        if id(automata) in self._renders_en_curso:
+            self._procesando_grafico = automata
+            self.btn_procesar.config(state=tk.DISABLED)
+
     def _mostrar_estadisticas_conversion(self):
         """Mostrar estadísticas de la conversión AFND a AFD"""
         if self.automata_original and self.automata_afd:
             orig_estados = len(self.automata_original.estados)
             afd_estados = len(self.automata_afd.estados)
-            self._mostrar_estado(f"📊 Estadísticas de conversión:\n", 'info')
-            self._mostrar_estado(f"   • Estados AFND original: {orig_estados}\n")
-            self._mostrar_estado(f"   • Estados AFD resultante: {afd_estados}\n")
-            self._mostrar_estado(f"   • Factor de expansión: {afd_estados/orig_estados:.2f}x\n")
+            self._mostrar_estados([
+                ("📊 Estadísticas de conversión:\n", 'info'),
+                (f"   • Estados AFND original: {orig_estados}\n"
+                 f"   • Estados AFD resultante: {afd_estados}\n"
+                 f"   • Factor de expansión: {afd_estados/orig_estados:.2f}x\n", 'normal'),
+            ])
 
     def _mostrar_estadisticas_minimizacion(self):
         """Mostrar estadísticas de la minimización"""
@@ -491,10 +873,12 @@ class GUIMinimizador:
             reduccion = orig_estados - min_estados
             porcentaje = (reduccion / orig_estados) * 100 if orig_estados > 0 else 0
             
-            self._mostrar_estado(f"📊 Estadísticas de minimización:\n", 'info')
-            self._mostrar_estado(f"   • Estados originales: {orig_estados}\n")
-            self._mostrar_estado(f"   • Estados minimizados: {min_estados}\n")
-            self._mostrar_estado(f"   • Reducción: {reduccion} estados ({porcentaje:.1f}%)\n")
+            self._mostrar_estados([
+                ("📊 Estadísticas de minimización:\n", 'info'),
+                (f"   • Estados originales: {orig_estados}\n"
+                 f"   • Estados minimizados: {min_estados}\n"
+                 f"   • Reducción: {reduccion} estados ({porcentaje:.1f}%)\n", 'normal'),
+            ])
 
     def _guardar_resultado(self):
         """Guardar el resultado como JSON"""
@@ -544,123 +928,128 @@ class GUIMinimizador:
             return
             
         try:
-            with open(archivo, 'w', encoding='utf-8') as f:
-                f.write("=" * 70 + "\n")
-                f.write("     INFORME DE PROCESAMIENTO DE AUTÓMATA FINITO\n")
-                f.write("=" * 70 + "\n\n")
+            # El informe se arma en memoria y se escribe al archivo de una sola vez
+            partes: List[str] = []
+            escribir = partes.append
+            escribir("=" * 70 + "\n")
+            escribir("     INFORME DE PROCESAMIENTO DE AUTÓMATA FINITO\n")
+            escribir("=" * 70 + "\n\n")
+            
+            # Información del autómata original
+            escribir("1. AUTÓMATA ORIGINAL\n")
+            escribir("-" * 40 + "\n")
+            escribir(f"   Tipo: {'AFND' if automata_procesado.KIND == AFND.KIND else 'AFD'}\n")
+            escribir(f"   Estados: {list(automata_procesado.estados)}\n")
+            escribir(f"   Alfabeto: {list(automata_procesado.alfabeto)}\n")
+            escribir(f"   Estado inicial: {automata_procesado.estado_inicial}\n")
+            escribir(f"   Estados finales: {list(automata_procesado.estados_finales)}\n")
+            escribir(f"   Lenguaje: {self.lenguaje}\n\n")
+            
+            # Validación
+            validacion = self._validar(automata_procesado)
+            escribir("2. VALIDACIÓN DEL AUTÓMATA ORIGINAL\n")
+            escribir("-" * 40 + "\n")
+            escribir(f"   Estado: {'✓ Válido' if validacion['es_valido'] else '✗ Inválido'}\n")
+            
+            if validacion["errores"]:
+                escribir("   Errores encontrados:\n")
+                for error in validacion["errores"]:
+                    escribir(f"     • {error}\n")
+                    
+            if validacion["advertencias"]:
+                escribir("   Advertencias:\n")
+                for adv in validacion["advertencias"]:
+                    escribir(f"     • {adv}\n")
+            escribir("\n")
+            
+            # Proceso realizado
+            escribir("3. PROCESO REALIZADO\n")
+            escribir("-" * 40 + "\n")
+            
+            # Verificar si hay proceso completo (conversión + minimización)
+            if self.automata_minimizado and self.automata_afd:
+                # Proceso completo: AFND → AFD → AFD mínimo
+                escribir("   Operaciones realizadas:\n")
+                escribir("   1. Conversión de AFND a AFD (Método: Construcción de subconjuntos)\n")
+                escribir("   2. Minimización de AFD (Método: Algoritmo k-equivalente)\n\n")
                 
-                # Información del autómata original
-                f.write("1. AUTÓMATA ORIGINAL\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"   Tipo: {'AFND' if isinstance(automata_procesado, AFND) else 'AFD'}\n")
-                f.write(f"   Estados: {list(automata_procesado.estados)}\n")
-                f.write(f"   Alfabeto: {list(automata_procesado.alfabeto)}\n")
-                f.write(f"   Estado inicial: {automata_procesado.estado_inicial}\n")
-                f.write(f"   Estados finales: {list(automata_procesado.estados_finales)}\n")
-                f.write(f"   Lenguaje: {self.lenguaje}\n\n")
+                escribir("4. AUTÓMATA INTERMEDIO (AFD)\n")
+                escribir("-" * 40 + "\n")
+                escribir(f"   Estados: {list(self.automata_afd.estados)}\n")
+                escribir(f"   Estado inicial: {self.automata_afd.estado_inicial}\n")
+                escribir(f"   Estados finales: {list(self.automata_afd.estados_finales)}\n\n")
                 
-                # Validación
-                validacion = self.automata_manager.validar_automata(automata_procesado)
-                f.write("2. VALIDACIÓN DEL AUTÓMATA ORIGINAL\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"   Estado: {'✓ Válido' if validacion['es_valido'] else '✗ Inválido'}\n")
+                escribir("5. AUTÓMATA RESULTANTE FINAL (AFD MÍNIMO)\n")
+                escribir("-" * 40 + "\n")
+                escribir(f"   Estados: {list(self.automata_minimizado.estados)}\n")
+                escribir(f"   Estado inicial: {self.automata_minimizado.estado_inicial}\n")
+                escribir(f"   Estados finales: {list(self.automata_minimizado.estados_finales)}\n\n")
                 
-                if validacion["errores"]:
-                    f.write("   Errores encontrados:\n")
-                    for error in validacion["errores"]:
-                        f.write(f"     • {error}\n")
-                        
-                if validacion["advertencias"]:
-                    f.write("   Advertencias:\n")
-                    for adv in validacion["advertencias"]:
-                        f.write(f"     • {adv}\n")
-                f.write("\n")
+                # Estadísticas
+                escribir("6. ESTADÍSTICAS\n")
+                escribir("-" * 40 + "\n")
+                # Conversión
+                afnd_est = len(self.automata_original.estados)
+                afd_est = len(self.automata_afd.estados)
+                escribir(f"   Conversión AFND → AFD:\n")
+                escribir(f"     Estados AFND: {afnd_est}\n")
+                escribir(f"     Estados AFD: {afd_est}\n")
+                escribir(f"     Factor de expansión: {afd_est/afnd_est:.2f}x\n\n")
+                # Minimización
+                min_est = len(self.automata_minimizado.estados)
+                red = afd_est - min_est
+                porc = (red/afd_est)*100 if afd_est > 0 else 0
+                escribir(f"   Minimización AFD → AFD mínimo:\n")
+                escribir(f"     Estados AFD: {afd_est}\n")
+                escribir(f"     Estados mínimos: {min_est}\n")
+                escribir(f"     Estados eliminados: {red}\n")
+                escribir(f"     Reducción: {porc:.1f}%\n")
                 
-                # Proceso realizado
-                f.write("3. PROCESO REALIZADO\n")
-                f.write("-" * 40 + "\n")
+            elif op == "afnd_afd":
+                escribir("   Operación: Conversión de AFND a AFD\n")
+                escribir("   Método: Construcción de subconjuntos\n\n")
+                escribir("4. AUTÓMATA RESULTANTE (AFD)\n")
+                escribir("-" * 40 + "\n")
+                escribir(f"   Estados: {list(self.automata_afd.estados)}\n")
+                escribir(f"   Estado inicial: {self.automata_afd.estado_inicial}\n")
+                escribir(f"   Estados finales: {list(self.automata_afd.estados_finales)}\n\n")
                 
-                # Verificar si hay proceso completo (conversión + minimización)
-                if self.automata_minimizado and self.automata_afd:
-                    # Proceso completo: AFND → AFD → AFD mínimo
-                    f.write("   Operaciones realizadas:\n")
-                    f.write("   1. Conversión de AFND a AFD (Método: Construcción de subconjuntos)\n")
-                    f.write("   2. Minimización de AFD (Método: Algoritmo k-equivalente)\n\n")
-                    
-                    f.write("4. AUTÓMATA INTERMEDIO (AFD)\n")
-                    f.write("-" * 40 + "\n")
-                    f.write(f"   Estados: {list(self.automata_afd.estados)}\n")
-                    f.write(f"   Estado inicial: {self.automata_afd.estado_inicial}\n")
-                    f.write(f"   Estados finales: {list(self.automata_afd.estados_finales)}\n\n")
-                    
-                    f.write("5. AUTÓMATA RESULTANTE FINAL (AFD MÍNIMO)\n")
-                    f.write("-" * 40 + "\n")
-                    f.write(f"   Estados: {list(self.automata_minimizado.estados)}\n")
-                    f.write(f"   Estado inicial: {self.automata_minimizado.estado_inicial}\n")
-                    f.write(f"   Estados finales: {list(self.automata_minimizado.estados_finales)}\n\n")
-                    
-                    # Estadísticas
-                    f.write("6. ESTADÍSTICAS\n")
-                    f.write("-" * 40 + "\n")
-                    # Conversión
-                    afnd_est = len(self.automata_original.estados)
-                    afd_est = len(self.automata_afd.estados)
-                    f.write(f"   Conversión AFND → AFD:\n")
-                    f.write(f"     Estados AFND: {afnd_est}\n")
-                    f.write(f"     Estados AFD: {afd_est}\n")
-                    f.write(f"     Factor de expansión: {afd_est/afnd_est:.2f}x\n\n")
-                    # Minimización
-                    min_est = len(self.automata_minimizado.estados)
-                    red = afd_est - min_est
-                    porc = (red/afd_est)*100 if afd_est > 0 else 0
-                    f.write(f"   Minimización AFD → AFD mínimo:\n")
-                    f.write(f"     Estados AFD: {afd_est}\n")
-                    f.write(f"     Estados mínimos: {min_est}\n")
-                    f.write(f"     Estados eliminados: {red}\n")
-                    f.write(f"     Reducción: {porc:.1f}%\n")
-                    
-                elif op == "afnd_afd":
-                    f.write("   Operación: Conversión de AFND a AFD\n")
-                    f.write("   Método: Construcción de subconjuntos\n\n")
-                    f.write("4. AUTÓMATA RESULTANTE (AFD)\n")
-                    f.write("-" * 40 + "\n")
-                    f.write(f"   Estados: {list(self.automata_afd.estados)}\n")
-                    f.write(f"   Estado inicial: {self.automata_afd.estado_inicial}\n")
-                    f.write(f"   Estados finales: {list(self.automata_afd.estados_finales)}\n\n")
-                    
-                    # Estadísticas
-                    f.write("5. ESTADÍSTICAS\n")
-                    f.write("-" * 40 + "\n")
-                    orig_est = len(automata_procesado.estados)
-                    res_est = len(self.automata_afd.estados)
-                    f.write(f"   Estados originales: {orig_est}\n")
-                    f.write(f"   Estados resultantes: {res_est}\n")
-                    f.write(f"   Factor de expansión: {res_est/orig_est:.2f}x\n")
-                    
-                elif op == "afd_min":
-                    f.write("   Operación: Minimización de AFD\n")
-                    f.write("   Método: Algoritmo k-equivalente\n\n")
-                    f.write("4. AUTÓMATA RESULTANTE (AFD MINIMIZADO)\n")
-                    f.write("-" * 40 + "\n")
-                    f.write(f"   Estados: {list(self.automata_minimizado.estados)}\n")
-                    f.write(f"   Estado inicial: {self.automata_minimizado.estado_inicial}\n")
-                    f.write(f"   Estados finales: {list(self.automata_minimizado.estados_finales)}\n\n")
-                    
-                    # Estadísticas
-                    f.write("5. ESTADÍSTICAS\n")
-                    f.write("-" * 40 + "\n")
-                    orig_est = len(automata_procesado.estados)
-                    res_est = len(self.automata_minimizado.estados)
-                    red = orig_est - res_est
-                    porc = (red/orig_est)*100 if orig_est > 0 else 0
-                    f.write(f"   Estados originales: {orig_est}\n")
-                    f.write(f"   Estados minimizados: {res_est}\n")
-                    f.write(f"   Estados eliminados: {red}\n")
-                    f.write(f"   Reducción: {porc:.1f}%\n")
+                # Estadísticas
+                escribir("5. ESTADÍSTICAS\n")
+                escribir("-" * 40 + "\n")
+                orig_est = len(automata_procesado.estados)
+                res_est = len(self.automata_afd.estados)
+                escribir(f"   Estados originales: {orig_est}\n")
+                escribir(f"   Estados resultantes: {res_est}\n")
+                escribir(f"   Factor de expansión: {res_est/orig_est:.2f}x\n")
                 
-                f.write("\n" + "=" * 70 + "\n")
-                f.write("                    FIN DEL INFORME\n")
-                f.write("=" * 70 + "\n")
+            elif op == "afd_min":
+                escribir("   Operación: Minimización de AFD\n")
+                escribir("   Método: Algoritmo k-equivalente\n\n")
+                escribir("4. AUTÓMATA RESULTANTE (AFD MINIMIZADO)\n")
+                escribir("-" * 40 + "\n")
+                escribir(f"   Estados: {list(self.automata_minimizado.estados)}\n")
+                escribir(f"   Estado inicial: {self.automata_minimizado.estado_inicial}\n")
+                escribir(f"   Estados finales: {list(self.automata_minimizado.estados_finales)}\n\n")
+                
+                # Estadísticas
+                escribir("5. ESTADÍSTICAS\n")
+                escribir("-" * 40 + "\n")
+                orig_est = len(automata_procesado.estados)
+                res_est = len(self.automata_minimizado.estados)
+                red = orig_est - res_est
+                porc = (red/orig_est)*100 if orig_est > 0 else 0
+                escribir(f"   Estados originales: {orig_est}\n")
+                escribir(f"   Estados minimizados: {res_est}\n")
+                escribir(f"   Estados eliminados: {red}\n")
+                escribir(f"   Reducción: {porc:.1f}%\n")
+            
+            escribir("\n" + "=" * 70 + "\n")
+            escribir("                    FIN DEL INFORME\n")
+            escribir("=" * 70 + "\n")
+            
+            with open(archivo, 'w', encoding='utf-8') as f:
+                f.write("".join(partes))
                 
             messagebox.showinfo("Éxito", f"Informe generado en:\n{archivo}")
             self._mostrar_estado(f"📊 Informe generado en: {archivo}\n", 'success')
@@ -682,27 +1071,20 @@ class GUIMinimizador:
         op = self.operacion.get()
         
         try:
-            # Probar en autómata original
-            orig_acepta = self.automata_original.procesar_cadena(cadena if cadena != "ε" else "")
-            resultado = f"Cadena '{cadena}': Original {'✓' if orig_acepta else '✗'}"
-            
-            resultados = [orig_acepta]
-            
-            # Probar en AFD si existe
+            # Probar en el autómata original y en el AFD y el minimizado si existen, todos juntos
+            resultados = self._aceptacion_cacheada(cadena if cadena != "ε" else "")
+            orig_acepta = resultados[0]
+            nombres = ["Original"]
             if self.automata_afd:
-                afd_acepta = self.automata_afd.procesar_cadena(cadena if cadena != "ε" else "")
-                resultado += f" | AFD {'✓' if afd_acepta else '✗'}"
-                resultados.append(afd_acepta)
-            
-            # Probar en minimizado si existe
+                nombres.append("AFD")
             if self.automata_minimizado:
-                min_acepta = self.automata_minimizado.procesar_cadena(cadena if cadena != "ε" else "")
-                resultado += f" | Minimizado {'✓' if min_acepta else '✗'}"
-                resultados.append(min_acepta)
+                nombres.append("Minimizado")
+            resultado = f"Cadena '{cadena}': " + " | ".join(
+                f"{nombre} {'✓' if acepta else '✗'}" for nombre, acepta in zip(nombres, resultados))
             
             # Verificar equivalencia entre todos
             if len(resultados) > 1:
-                equivalente = all(r == resultados[0] for r in resultados)
+                equivalente = resultados.count(resultados[0]) == len(resultados)
                 resultado += f" | {'✓ Equivalentes' if equivalente else '✗ NO equivalentes'}"
             
             # Actualizar label de resultado
@@ -715,53 +1097,373 @@ class GUIMinimizador:
             messagebox.showerror("Error", f"Error al probar cadena:\n{str(e)}")
             self._mostrar_estado(f"❌ Error al probar cadena: {str(e)}\n", 'error')
 
-    def _generar_grafico_original(self):
-        """Generar y mostrar gráfico del autómata original"""
-        if not self.automata_original:
+    def _validar(self, automata: Union[AFD, AFND]) -> Dict[str, Any]:
+        """Validar un autómata, reutilizando el resultado si ya se validó"""
+        entrada = self._validaciones.get(id(automata))
+        if entrada is None or entrada[0] is not automata:
+            entrada = (automata, self.automata_manager.validar_automata(automata))
+            self._validaciones[id(automata)] = entrada
+        return entrada[1]
+
+    def _procesar_en_paneles(self, cadena: str) -> Tuple[bool, ...]:
+        """
+        Procesar una cadena con los autómatas de todos los paneles (se usa a través del caché)
+
+        Returns:
+            Resultado del original y, si existen, del AFD y del minimizado, en ese orden
+        """
+        automatas = [automata for automata in (self.automata_original, self.automata_afd,
+                                               self.automata_minimizado) if automata]
+        return tuple(self.automata_manager.procesar_cadena_lote(cadena, automatas))
+
+    def _generar_grafico(self, panel: str):
+        """
+        Generar y mostrar el gráfico del autómata de un panel
+
+        Args:
+            panel: 'original', 'afd' o 'minimizado'
+        """
+        automata = getattr(self, f"automata_{panel}")
+        if not automata:
             return
+        canvas = getattr(self, f"canvas_{panel}")
         try:
             # Generar imagen si no existe
-            if self.imagen_original_pil is None:
-                self.imagen_original_pil = self._crear_grafico_automata(self.automata_original)
-            self._mostrar_grafico_en_canvas(self.canvas_original, self.imagen_original_pil, self.zoom_original, 'original')
+            imagen_pil = getattr(self, f"imagen_{panel}_pil")
+            if imagen_pil is None:
+                imagen_pil = self._obtener_imagen_automata(automata, panel)
+                setattr(self, f"imagen_{panel}_pil", imagen_pil)
+                if imagen_pil is None:
+                    return  # Se muestra cuando termine el renderizado en segundo plano
+            self._mostrar_grafico_en_canvas(canvas, imagen_pil, getattr(self, f"zoom_{panel}"), panel)
         except Exception as e:
-            self._mostrar_estado(f"❌ Error al generar gráfico original: {str(e)}\n", 'error')
-            self._mostrar_placeholder(self.canvas_original, "Error al generar gráfico")
-
-    def _generar_grafico_afd(self):
-        """Generar y mostrar gráfico del AFD convertido"""
-        if not self.automata_afd:
-            return
+            self._mostrar_estado(f"❌ Error al generar gráfico {self.NOMBRES_PANEL[panel]}: {str(e)}\n", 'error')
+            self._mostrar_placeholder(canvas, "Error al generar gráfico")
+
+    def _obtener_imagen_automata(self, automata: Union[AFD, AFND], panel: str) -> "Optional[Image.Image]":
+        """
+        Obtener la imagen de un autómata desde el caché o lanzar su renderizado
+
+        Si la imagen no está en caché se genera en un hilo aparte (Graphviz puede
+        tardar cientos de ms) y el panel se redibuja al terminar.
+
+        Args:
+            automata: Autómata a graficar
+            panel: Panel donde se mostrará ('original', 'afd' o 'minimizado')
+
+        Returns:
+            Imagen PIL en modo RGB, o None si se está generando
+        """
+        clave = _clave_contenido(automata)
+        entrada = self._graficos.get(clave)
+        if entrada is not None:
+            self._graficos.move_to_end(clave)
+            return entrada.imagen
+
+        self._mostrar_placeholder(getattr(self, f"canvas_{panel}"), "Generando gráfico...")
+        if id(automata) not in self._renders_en_curso:
+            self._renders_en_curso[id(automata)] = automata
+            self._render_pool.submit(self._render_worker, panel, automata)
+        self._programar_drenado_render()
+        return None
+
+    def _render_worker(self, panel: str, automata: Union[AFD, AFND]):
+        """Generar la imagen de un autómata fuera del hilo de Tk (no toca widgets)"""
         try:
-            # Generar imagen si no existe
-            if self.imagen_afd_pil is None:
-                self.imagen_afd_pil = self._crear_grafico_automata(self.automata_afd)
-            self._mostrar_grafico_en_canvas(self.canvas_afd, self.imagen_afd_pil, self.zoom_afd, 'afd')
+            # Convertir una sola vez a RGB: los zooms posteriores solo redimensionan. El fondo del
+            # gráfico es blanco opaco, así que el canal alfa solo agregaría un byte por píxel a cada
+            # remuestreo y a cada copia hacia Tk
+            imagen = self._crear_grafico_automata(automata).convert("RGB")
+            # La pirámide para el zoom también se arma acá, fuera del hilo de Tk
+            self._cola_render.put((panel, automata, imagen, _construir_piramide(imagen), None))
         except Exception as e:
-            self._mostrar_estado(f"❌ Error al generar gráfico AFD: {str(e)}\n", 'error')
-            self._mostrar_placeholder(self.canvas_afd, "Error al generar gráfico")
+            self._cola_render.put((panel, automata, None, None, e))
+
+    def _programar_drenado_render(self):
+        """Programar la revisión de la cola de renderizado si no está programada"""
+        if self._drenado_after_id is None:
+            self._drenado_after_id = self.root.after(50, self._drenar_cola_render)
 
-    def _generar_grafico_minimizado(self):
-        """Generar y mostrar gráfico del AFD minimizado"""
-        if not self.automata_minimizado:
+    def _drenar_cola_render(self):
+        """Mostrar en su panel las imágenes que terminaron de generarse"""
+        self._drenado_after_id = None
+        while True:
+            try:
+                panel, automata, imagen, niveles, error = self._cola_render.get_nowait()
+            except queue.Empty:
+                break
+            self._renders_en_curso.pop(id(automata), None)
+            if automata is self._procesando_grafico:
+                self._procesando_grafico = None
+                self.btn_procesar.config(state=tk.NORMAL)
+            if imagen is not None:
+                self._guardar_grafico(_clave_contenido(automata), _EntradaGrafico(imagen, niveles))
+
+            # Ignorar resultados de autómatas que ya no están en el panel
+            if getattr(self, f"automata_{panel}") is not automata:
+                continue
+            if error is not None:
+                self._mostrar_estado(f"❌ Error al generar gráfico {self.NOMBRES_PANEL[panel]}: {str(error)}\n", 'error')
+                self._mostrar_placeholder(getattr(self, f"canvas_{panel}"), "Error al generar gráfico")
+            else:
+                self._generar_grafico(panel)
+
+        if self._renders_en_curso:
+            self._programar_drenado_render()
+
+    def _guardar_grafico(self, clave: tuple, entrada: _EntradaGrafico):
+        """Agregar una entrada al caché de gráficos (reemplaza a la anterior con la misma clave)"""
+        anterior = self._graficos.pop(clave, None)
+        if anterior is not None:
+            self._graficos_por_imagen.pop(id(anterior.imagen), None)
+            self._memoria_graficos -= anterior.memoria
+        self._graficos[clave] = entrada
+        self._graficos_por_imagen[id(entrada.imagen)] = entrada
+        self._memoria_graficos += entrada.memoria
+        self._recortar_graficos()
+
+    def _recortar_graficos(self):
+        """
+        Descartar las entradas usadas hace más tiempo hasta que el caché de gráficos entre en
+        memoria_maxima_graficos (se conservan las imágenes que muestra algún panel y la última
+        agregada, que todavía no llegó a su panel)
+        """
+        if self._memoria_graficos <= self.memoria_maxima_graficos:
             return
+        en_uso = {id(getattr(self, f"imagen_{panel}_pil")) for panel in self.NOMBRES_PANEL}
+        for clave in list(self._graficos)[:-1]:
+            if self._memoria_graficos <= self.memoria_maxima_graficos:
+                break
+            entrada = self._graficos[clave]
+            if id(entrada.imagen) in en_uso:
+                continue
+            del self._graficos[clave]
+            del self._graficos_por_imagen[id(entrada.imagen)]
+            self._memoria_graficos -= entrada.memoria
+
+    def _entrada_grafico(self, imagen_pil: "Image.Image") -> _EntradaGrafico:
+        """
+        Entrada del caché de gráficos de una imagen
+
+        Returns:
+            La entrada de la imagen, o una entrada suelta (fuera del caché, sus derivadas no se
+            conservan) si la imagen no salió de _graficos
+        """
+        entrada = self._graficos_por_imagen.get(id(imagen_pil))
+        if entrada is None or entrada.imagen is not imagen_pil:
+            return _EntradaGrafico(imagen_pil, [imagen_pil])
+        return entrada
+
+    def _sumar_memoria(self, entrada: _EntradaGrafico, diferencia: int):
+        """Actualizar la memoria de una entrada, y la del caché si la entrada está en él"""
+        entrada.memoria += diferencia
+        if self._graficos_por_imagen.get(id(entrada.imagen)) is entrada:
+            self._memoria_graficos += diferencia
+            if diferencia > 0:
+                self._recortar_graficos()
+
+    def _nivel_piramide(self, imagen_pil: "Image.Image", zoom: float) -> "Image.Image":
+        """
+        Obtener el nivel de la pirámide más pequeño que no quede por debajo del zoom pedido
+
+        Args:
+            imagen_pil: Imagen original (nivel 0)
+            zoom: Zoom con el que se va a mostrar
+
+        Returns:
+            Imagen desde la cual redimensionar (reducida 2^k veces, con 2^-k >= zoom)
+        """
+        if zoom > 0.5:
+            return imagen_pil
+
+        entrada = self._entrada_grafico(imagen_pil)
+        niveles = entrada.niveles
+        nivel = int(-math.log2(zoom))
+        while len(niveles) <= nivel:
+            anterior = niveles[-1]
+            if anterior.width < 2 or anterior.height < 2:
+                break
+            # reduce(2) promedia bloques de 2x2 en C: mucho más barato que un LANCZOS a la
+            # mitad y suficiente, porque el redimensionado final filtra de nuevo
+            niveles.append(anterior.reduce(2))
+            self._sumar_memoria(entrada, _memoria_imagen(niveles[-1]))
+        return niveles[min(nivel, len(niveles) - 1)]
+
+    def _rasterizar_svg(self, imagen_pil: "Image.Image", ancho: int, alto: int) -> "Optional[Image.Image]":
+        """
+        Rasterizar el SVG asociado a una imagen exactamente al tamaño pedido
+
+        Args:
+            imagen_pil: Imagen generada por _crear_grafico_automata
+            ancho: Ancho final en píxeles
+            alto: Alto final en píxeles
+
+        Returns:
+            Imagen RGB del tamaño pedido, o None si no hay SVG o cairosvg
+        """
+        svg = imagen_pil.info.get('svg')
+        cairosvg = _cairosvg()
+        if svg is None or cairosvg is None or ancho < 1 or alto < 1:
+            return None
+        Image, _ = _pil()
         try:
-            # Generar imagen si no existe
-            if self.imagen_minimizado_pil is None:
-                self.imagen_minimizado_pil = self._crear_grafico_automata(self.automata_minimizado)
-            self._mostrar_grafico_en_canvas(self.canvas_minimizado, self.imagen_minimizado_pil, self.zoom_minimizado, 'minimizado')
+            png_bytes = cairosvg.svg2png(bytestring=svg, output_width=ancho, output_height=alto,
+                                         background_color='white')
+            return Image.open(io.BytesIO(png_bytes)).convert("RGB")
         except Exception as e:
-            self._mostrar_estado(f"❌ Error al generar gráfico minimizado: {str(e)}\n", 'error')
-            self._mostrar_placeholder(self.canvas_minimizado, "Error al generar gráfico")
-
-    def _mostrar_grafico_en_canvas(self, canvas, imagen_pil, zoom=1.0, panel='original'):
-        """Mostrar un gráfico en un canvas con ajuste de tamaño y zoom"""
+            log.debug("No se pudo rasterizar el SVG, se usa el PNG: %s", e)
+            return None
+
+    def _buscar_zoom_cacheado(self, imagen_base: "Image.Image",
+                              tamano: Tuple[int, int]) -> "Optional[Image.Image]":
+        """Devolver la versión de una imagen ya redimensionada a ese tamaño, si existe"""
+        versiones = self._entrada_grafico(imagen_base).zooms
+        imagen = versiones.get(tamano)
+        if imagen is not None:
+            versiones.move_to_end(tamano)
+        return imagen
+
+    def _guardar_zoom_cacheado(self, imagen_base: "Image.Image", imagen: "Image.Image"):
+        """Guardar una versión redimensionada, descartando la menos usada si se excede el límite"""
+        entrada = self._entrada_grafico(imagen_base)
+        versiones = entrada.zooms
+        anterior = versiones.pop(imagen.size, None)
+        diferencia = _memoria_imagen(imagen) - (_memoria_imagen(anterior) if anterior is not None else 0)
+        versiones[imagen.size] = imagen
+        while len(versiones) > self.tamano_zoom_cache:
+            diferencia -= _memoria_imagen(versiones.popitem(last=False)[1])
+        self._sumar_memoria(entrada, diferencia)
+
+    @classmethod
+    def _factor_tk(cls, zoom: float) -> Optional[Tuple[int, int]]:
+        """
+        Factor entero más cercano a un zoom, si está dentro de TOLERANCIA_ZOOM_TK
+
+        Returns:
+            (n, 1) para ampliar n veces (1x, 2x, 3x, ...), (1, n) para reducir a 1/n,
+            o None si el zoom no está cerca de ninguno de los dos
+        """
+        if zoom >= 1:
+            factor = round(zoom)
+            return (factor, 1) if abs(zoom - factor) < cls.TOLERANCIA_ZOOM_TK else None
+        factor = round(1 / zoom)
+        return (1, factor) if abs(1 / zoom - factor) < cls.TOLERANCIA_ZOOM_TK else None
+
+    def _escalar_en_tk(self, panel: str, imagen_base: "Image.Image", factor: Tuple[int, int],
+                       imagen_tk: "Optional[ImageTk.PhotoImage]",
+                       region: Tuple[int, int, int, int]) -> "ImageTk.PhotoImage":
+        """
+        Escalar la imagen del panel un factor entero con 'copy -zoom' o 'copy -subsample' de Tk
+
+        Args:
+            panel: Panel a redibujar
+            imagen_base: Imagen PIL sin zoom del panel
+            factor: (ampliación, reducción) devuelto por _factor_tk
+            imagen_tk: PhotoImage actual del panel; se reutiliza si ya tiene el tamaño final
+            region: Rectángulo (izquierda, arriba, derecha, abajo) de la imagen base a escalar
+
+        Returns:
+            PhotoImage del panel con la imagen escalada
+        """
+        _, ImageTk = _pil()
+        entrada = self._entrada_grafico(imagen_base)
+        if entrada.foto_base is None:
+            entrada.foto_base = ImageTk.PhotoImage(imagen_base)
+            self._sumar_memoria(entrada, imagen_base.width * imagen_base.height * 4)  # RGBA en Tk
+
+        izquierda, arriba, derecha, abajo = region
+        ampliacion, reduccion = factor
+        if reduccion > 1:
+            # -subsample toma uno de cada n píxeles (redondeando hacia arriba el tamaño)
+            opciones = ('-subsample', reduccion, reduccion)
+            tamano = (-(-(derecha - izquierda) // reduccion), -(-(abajo - arriba) // reduccion))
+        else:
+            opciones = ('-zoom', ampliacion, ampliacion)
+            tamano = ((derecha - izquierda) * ampliacion, (abajo - arriba) * ampliacion)
+        if imagen_tk is None or (imagen_tk.width(), imagen_tk.height()) != tamano:
+            imagen_tk = ImageTk.PhotoImage(imagen_base.mode, tamano)
+            self._tk_images[panel] = imagen_tk
+        self.root.tk.call(str(imagen_tk), 'copy', str(entrada.foto_base), '-from', izquierda, arriba, derecha, abajo,
+                          *opciones)
+        return imagen_tk
+
+    @staticmethod
+    def _rango_ventana(total: int, desplazamiento: float, maximo: int) -> Tuple[int, int]:
+        """
+        Tramo [inicio, fin) de un eje de la imagen ampliada que conviene generar
+
+        Args:
+            total: Lado de la imagen ampliada en ese eje
+            desplazamiento: Offset del panel en ese eje
+            maximo: Lado máximo a generar
+
+        Returns:
+            Todo el eje si mide a lo sumo maximo; si no, maximo píxeles centrados en el
+            centro del canvas sin salirse de la imagen
+        """
+        if total <= maximo:
+            return 0, total
+        # El centro del canvas cae en total // 2 - desplazamiento de la imagen ampliada
+        centro = total // 2 - int(desplazamiento)
+        inicio = min(max(centro - maximo // 2, 0), total - maximo)
+        return inicio, inicio + maximo
+
+    def _calcular_ventana(self, panel: str, ancho: int, alto: int) -> Tuple[int, int, int, int]:
+        """Rectángulo de la imagen ampliada (ancho x alto) a generar para la posición actual del panel"""
+        canvas_width, canvas_height = self._tamano_canvas[panel]
+        offset = getattr(self, f"offset_{panel}")
+        izquierda, derecha = self._rango_ventana(ancho, offset['x'], canvas_width * self.sobredibujo)
+        arriba, abajo = self._rango_ventana(alto, offset['y'], canvas_height * self.sobredibujo)
+        return (izquierda, arriba, derecha, abajo)
+
+    def _ventana_cubre(self, panel: str, vista: tuple) -> bool:
+        """Si la ventana generada de una vista incluye toda la parte de la imagen visible en el canvas"""
+        ancho, alto, _, (izquierda, arriba, derecha, abajo) = vista
+        canvas_width, canvas_height = self._tamano_canvas[panel]
+        offset = getattr(self, f"offset_{panel}")
+        for total, visible, desplazamiento, inicio, fin in ((ancho, canvas_width, offset['x'], izquierda, derecha),
+                                                            (alto, canvas_height, offset['y'], arriba, abajo)):
+            # Borde de la imagen ampliada en coordenadas del canvas y tramo visible de ella
+            borde = visible // 2 + int(desplazamiento) - total // 2
+            inicio_visible = max(-borde, 0)
+            fin_visible = min(visible - borde, total)
+            if inicio_visible < fin_visible and (inicio_visible < inicio or fin_visible > fin):
+                return False
+        return True
+
+    def _posicion_imagen(self, panel: str, vista: tuple) -> Tuple[float, float]:
+        """Coordenadas del centro del ítem de imagen del panel para mostrar una vista"""
+        ancho, alto, _, (izquierda, arriba, derecha, abajo) = vista
+        canvas_width, canvas_height = self._tamano_canvas[panel]
+        offset = getattr(self, f"offset_{panel}")
+        # Borde de la imagen ampliada completa más la posición del centro de la ventana dentro de ella
+        x = canvas_width // 2 + offset['x'] - ancho // 2 + izquierda + (derecha - izquierda) // 2
+        y = canvas_height // 2 + offset['y'] - alto // 2 + arriba + (abajo - arriba) // 2
+        return x, y
+
+    def _mostrar_grafico_en_canvas(self, canvas, imagen_pil, zoom=1.0, panel='original',
+                                   calidad_final=True):
+        """
+        Mostrar un gráfico en un canvas con ajuste de tamaño y zoom
+
+        Args:
+            calidad_final: Si es False se redimensiona con NEAREST (mucho más rápido),
+                           pensado para los redibujados intermedios durante el zoom
+        """
         # La imagen ya es un objeto PIL Image
+        Image, ImageTk = _pil()
+        # Los gráficos de Graphviz están renderizados a mayor resolución (info['escala']): el
+        # zoom pedido es relativo a 96 dpi, así que sobre sus píxeles se aplica zoom / escala
+        zoom = zoom / imagen_pil.info.get('escala', 1)
+        
+        # Mientras se interactúa, un zoom cercano a un factor entero (o a 1/n) se redondea a
+        # ese factor: Tk escala la imagen directamente, sin pasar por PIL
+        factor = None if calidad_final else self._factor_tk(zoom)
+        if factor is not None:
+            zoom = factor[0] / factor[1]
         
         # Obtener dimensiones actuales del canvas y de la imagen
-        canvas.update_idletasks()  # Asegurar que el canvas tenga sus dimensiones actualizadas
-        canvas_width = canvas.winfo_width() if canvas.winfo_width() > 1 else 350
-        canvas_height = canvas.winfo_height() if canvas.winfo_height() > 1 else 200
+        canvas_width, canvas_height = self._tamano_canvas[panel]
         img_width, img_height = imagen_pil.size
         
         # Aplicar zoom a las dimensiones originales
@@ -775,52 +1477,136 @@ class GUIMinimizador:
         final_width = int(zoomed_width * scale_factor)
         final_height = int(zoomed_height * scale_factor)
         
-        # Redimensionar la imagen siempre que haya zoom o el tamaño haya cambiado
-        if zoom != 1.0 or final_width != img_width or final_height != img_height:
-            # Usar BICUBIC para mejor calidad en zoom
-            imagen_pil = imagen_pil.resize((final_width, final_height), Image.Resampling.BICUBIC)
-        
-        # Convertir a PhotoImage
-        imagen_tk = ImageTk.PhotoImage(imagen_pil)
+        # Si el panel ya muestra esta misma imagen con el mismo tamaño y calidad (por ejemplo
+        # al arrastrar), se reutiliza su PhotoImage sin ningún trabajo de PIL. Con zoom muy
+        # grande solo se genera una ventana alrededor de la zona visible: se conserva mientras
+        # siga cubriendo lo que muestra el canvas
+        redimensionar = zoom != 1.0 or final_width != img_width or final_height != img_height
+        vista = (final_width, final_height, calidad_final or not redimensionar)
+        vista_actual = self._vista_actual.get(panel)
+        if (vista_actual is not None and vista_actual[0] is imagen_pil and vista_actual[1][:3] == vista
+                and self._ventana_cubre(panel, vista_actual[1])):
+            vista = vista_actual[1]
+        else:
+            vista += (self._calcular_ventana(panel, final_width, final_height),)
+        imagen_tk = self._tk_images.get(panel)
+        if (imagen_tk is None or vista_actual is None
+                or vista_actual[0] is not imagen_pil or vista_actual[1] != vista):
+            imagen_base = imagen_pil
+            ventana = vista[3]
+            recortada = ventana != (0, 0, final_width, final_height)
+            
+            if factor is not None and redimensionar:
+                # Factor entero durante la interacción: Tk replica o salta píxeles en C
+                # a partir de una copia de la imagen base, sin pasar por PIL. La ventana se
+                # ajusta a múltiplos del factor para que corresponda a píxeles enteros de la base
+                ampliacion, reduccion = factor
+                region = (ventana[0] * reduccion // ampliacion, ventana[1] * reduccion // ampliacion,
+                          -(-ventana[2] * reduccion // ampliacion), -(-ventana[3] * reduccion // ampliacion))
+                vista = vista[:3] + (tuple(borde * ampliacion // reduccion for borde in region),)
+                imagen_tk = self._escalar_en_tk(panel, imagen_base, factor, imagen_tk, region)
+            else:
+                # Redimensionar la imagen siempre que haya zoom o el tamaño haya cambiado.
+                # Las versiones recortadas dependen de la posición: no pasan por el caché ni
+                # por el SVG (que se rasterizaría completo)
+                imagen_svg = None
+                cacheada = None
+                if redimensionar and calidad_final and not recortada:
+                    cacheada = self._buscar_zoom_cacheado(imagen_pil, (final_width, final_height))
+                    if cacheada is None:
+                        imagen_svg = self._rasterizar_svg(imagen_pil, final_width, final_height)
+                if cacheada is not None:
+                    imagen_pil = cacheada
+                elif imagen_svg is not None:
+                    imagen_pil = imagen_svg
+                elif redimensionar:
+                    # Usar BICUBIC para mejor calidad en zoom (NEAREST mientras se interactúa)
+                    filtro = Image.Resampling.BICUBIC if calidad_final else Image.Resampling.NEAREST
+                    # Al alejar se parte del nivel de la pirámide más cercano, no de la imagen completa
+                    origen = self._nivel_piramide(imagen_pil, zoom)
+                    # Solo se remuestrea la ventana: box es el mismo rectángulo en píxeles del origen
+                    escala_x = origen.width / final_width
+                    escala_y = origen.height / final_height
+                    caja = (ventana[0] * escala_x, ventana[1] * escala_y,
+                            ventana[2] * escala_x, ventana[3] * escala_y)
+                    tamano = (ventana[2] - ventana[0], ventana[3] - ventana[1])
+                    if calidad_final and final_width < origen.width:
+                        # Si todavía hay que achicar, reducing_gap hace primero una reducción
+                        # entera por bloques y aplica el filtro solo sobre el último tramo
+                        imagen_pil = origen.resize(tamano, filtro, box=caja, reducing_gap=2.0)
+                    else:
+                        imagen_pil = origen.resize(tamano, filtro, box=caja)
+                elif recortada:
+                    # Sin zoom pero más grande que el canvas: solo se recorta la ventana
+                    imagen_pil = imagen_pil.crop(ventana)
+                if redimensionar and calidad_final and cacheada is None and not recortada:
+                    self._guardar_zoom_cacheado(imagen_base, imagen_pil)
+            
+                log.debug("Redimensionando %dx%d -> %dx%d (zoom=%.2f)",
+                          img_width, img_height, final_width, final_height, zoom)
+            
+                # Convertir a PhotoImage (reutilizando la del panel si tiene el mismo tamaño)
+                if imagen_tk is not None and (imagen_tk.width(), imagen_tk.height()) == imagen_pil.size:
+                    imagen_tk.paste(imagen_pil)
+                else:
+                    imagen_tk = ImageTk.PhotoImage(imagen_pil)
+                    self._tk_images[panel] = imagen_tk
+            self._vista_actual[panel] = (imagen_base, vista)
         
-        # Limpiar canvas y mostrar imagen centrada con offset
-        canvas.delete("all")
-        offset = getattr(self, f"offset_{panel}")
-        x = canvas_width // 2 + offset['x']
-        y = canvas_height // 2 + offset['y']
-        canvas.create_image(x, y, image=imagen_tk, anchor='center')
+        # Mostrar imagen centrada con offset. Si el canvas ya tiene el ítem de imagen del panel
+        # solo se actualiza; si no (primera vez o tras un placeholder) se oculta el placeholder
+        # y se crea
+        x, y = self._posicion_imagen(panel, vista)
+        item = self._canvas_image_ids.get(panel)
+        if item is not None and canvas.type(item) == 'image':
+            canvas.itemconfig(item, image=imagen_tk)
+            canvas.coords(item, x, y)
+        else:
+            canvas.itemconfig("placeholder", state='hidden')
+            self._canvas_image_ids[panel] = canvas.create_image(x, y, image=imagen_tk, anchor='center',
+                                                                tags=("grafico",))
         
         # Guardar referencia para evitar que sea recolectada por garbage collector
         canvas.image = imagen_tk
 
     def _crear_imagen_prueba(self, automata):
-        """Crear una imagen de prueba simple cuando pydot no está disponible"""
+        """Crear una imagen de prueba simple cuando Graphviz no está disponible"""
         from PIL import Image, ImageDraw
 
         # Crear imagen
         img = Image.new('RGB', (400, 300), 'white')
         draw = ImageDraw.Draw(img)
+        fuente, mitad_alto = _fuente()
+
+        def texto_centrado(x, y, texto, color='black'):
+            # Centrado con el ancho de la cadena; la altura de línea ya está precalculada
+            draw.text((x - fuente.getlength(texto) / 2, y - mitad_alto), texto, font=fuente, fill=color)
 
         # Dibujar elementos básicos
         # Título
-        draw.text((200, 30), f"Autómata: {type(automata).__name__}", fill='black', anchor='mm')
+        texto_centrado(200, 30, f"Autómata: {type(automata).__name__}")
 
-        # Estados
+        # Conjuntos consultados por estado, resueltos una sola vez
+        finales = frozenset(automata.estados_finales)
+        inicial = automata.estado_inicial
+
+        # Estados: solo las filas que entran en la imagen (las demás quedarían fuera del lienzo)
         y_pos = 80
-        for i, estado in enumerate(automata.estados):
-            color = 'lightgreen' if estado in automata.estados_finales else 'lightblue'
+        filas_visibles = (img.height - y_pos) // 40 + 1
+        for i, estado in enumerate(itertools.islice(automata.estados, filas_visibles)):
+            color = 'lightgreen' if estado in finales else 'lightblue'
             draw.rectangle([50, y_pos + i*40, 150, y_pos + i*40 + 30], fill=color, outline='black')
-            draw.text((100, y_pos + i*40 + 15), str(estado), fill='black', anchor='mm')
+            texto_centrado(100, y_pos + i*40 + 15, str(estado))
 
             # Marcar estado inicial
-            if estado == automata.estado_inicial:
-                draw.text((30, y_pos + i*40 + 15), "→", fill='red', anchor='mm')
+            if estado == inicial:
+                texto_centrado(30, y_pos + i*40 + 15, "→", 'red')
 
         # Información básica
-        draw.text((250, 100), f"Estados: {len(automata.estados)}", fill='black')
-        draw.text((250, 130), f"Alfabeto: {list(automata.alfabeto)}", fill='black')
-        draw.text((250, 160), f"Estado inicial: {automata.estado_inicial}", fill='black')
-        draw.text((250, 190), f"Estados finales: {list(automata.estados_finales)}", fill='black')
+        draw.text((250, 100), f"Estados: {len(automata.estados)}", font=fuente, fill='black')
+        draw.text((250, 130), f"Alfabeto: {sorted(automata.alfabeto)}", font=fuente, fill='black')
+        draw.text((250, 160), f"Estado inicial: {inicial}", font=fuente, fill='black')
+        draw.text((250, 190), f"Estados finales: {sorted(finales)}", font=fuente, fill='black')
 
         # Devolver la imagen PIL directamente
         return img
@@ -858,7 +1644,7 @@ class GUIMinimizador:
         
         # Solo hacer zoom si hay una imagen cargada
         if not imagen_pil:
-            print("No hay imagen cargada para hacer zoom")
+            log.debug("No hay imagen cargada para hacer zoom en el panel %s", panel)
             return
         
         # Calcular nuevo zoom
@@ -872,9 +1658,7 @@ class GUIMinimizador:
         # Solo actualizar si cambió significativamente
         if abs(new_zoom - current_zoom) > 0.01:
             # Calcular nuevo offset para mantener el punto bajo el cursor
-            canvas.update_idletasks()
-            canvas_width = canvas.winfo_width() if canvas.winfo_width() > 1 else 350
-            canvas_height = canvas.winfo_height() if canvas.winfo_height() > 1 else 200
+            canvas_width, canvas_height = self._tamano_canvas[panel]
             canvas_center_x = canvas_width // 2
             canvas_center_y = canvas_height // 2
             
@@ -900,15 +1684,66 @@ class GUIMinimizador:
             setattr(self, zoom_var, new_zoom)
             setattr(self, f"offset_{panel}", {'x': new_offset_x, 'y': new_offset_y})
             
-            # Aplicar zoom a la imagen guardada
-            try:
-                self._mostrar_grafico_en_canvas(canvas, imagen_pil, new_zoom, panel)
-                
-            except Exception as e:
-                self._mostrar_estado(f"❌ Error al aplicar zoom: {str(e)}\n", 'error')
-                print(f"Error al aplicar zoom: {e}")
+            # Programar un único redibujado: si llegan más eventos antes de que se
+            # ejecute, se cancela y se reprograma con el zoom acumulado
+            after_id = self._zoom_after_id[panel]
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+            self._zoom_after_id[panel] = self.root.after(
+                self.zoom_delay_ms, lambda: self._aplicar_zoom_pendiente(panel))
+        else:
+            log.debug("Cambio de zoom muy pequeño en el panel %s, ignorando", panel)
+
+    def _aplicar_zoom_pendiente(self, panel):
+        """Redibujar un panel con el zoom acumulado por los eventos de rueda"""
+        self._zoom_after_id[panel] = None
+        if self._redibujar_panel(panel, calidad_final=False):
+            # Reprogramar el redibujado de calidad final hasta que la rueda se detenga
+            after_id = self._calidad_after_id[panel]
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+            self._calidad_after_id[panel] = self.root.after(
+                self.calidad_delay_ms, lambda: self._aplicar_calidad_final(panel))
+
+    def _aplicar_calidad_final(self, panel):
+        """Redibujar un panel con el filtro de alta calidad una vez terminado el zoom"""
+        self._calidad_after_id[panel] = None
+        self._redibujar_panel(panel, calidad_final=True)
+
+    def _redibujar_panel(self, panel, calidad_final=True):
+        """
+        Redibujar un panel con su imagen y zoom actuales
+
+        Returns:
+            True si había imagen y se pudo redibujar
+        """
+        imagen_pil = getattr(self, f"imagen_{panel}_pil")
+        if not imagen_pil:
+            return False
+        try:
+            self._mostrar_grafico_en_canvas(getattr(self, f"canvas_{panel}"), imagen_pil,
+                                            getattr(self, f"zoom_{panel}"), panel,
+                                            calidad_final=calidad_final)
+            return True
+        except Exception as e:
+            self._mostrar_estado(f"❌ Error al aplicar zoom: {str(e)}\n", 'error')
+            log.exception("Error al aplicar zoom en el panel %s", panel)
+            return False
+
+    def _canvas_redimensionado(self, event, panel):
+        """Guardar el nuevo tamaño del canvas y recentrar su gráfico"""
+        if event.width <= 1 or event.height <= 1:
+            return
+        self._tamano_canvas[panel] = (event.width, event.height)
+        item = self._canvas_image_ids.get(panel)
+        vista_actual = self._vista_actual.get(panel)
+        if item is None or vista_actual is None:
+            return
+        if self._ventana_cubre(panel, vista_actual[1]):
+            event.widget.coords(item, *self._posicion_imagen(panel, vista_actual[1]))
         else:
-            print("Cambio de zoom muy pequeño, ignorando")
+            # El canvas creció más allá de la parte generada de la imagen
+            self._redibujar_panel(panel)
 
     def _start_drag(self, event, panel):
         """Iniciar el arrastre de la imagen"""
@@ -928,178 +1763,165 @@ class GUIMinimizador:
             new_offset = {'x': offset['x'] + dx, 'y': offset['y'] + dy}
             setattr(self, f"offset_{panel}", new_offset)
             
-            # Redibujar la imagen
-            imagen_pil = getattr(self, f"imagen_{panel}_pil")
-            if imagen_pil:
-                zoom = getattr(self, f"zoom_{panel}")
-                canvas = getattr(self, f"canvas_{panel}")
-                self._mostrar_grafico_en_canvas(canvas, imagen_pil, zoom, panel)
-
-    def _crear_grafico_automata(self, automata: Union[AFD, AFND]) -> Image.Image:
-        """Crear gráfico de autómata usando pydot con mejor estilo"""
-        try:
-            # Verificar disponibilidad de graphviz
-            test_grafo = pydot.Dot()
-            test_grafo.create_png()
-        except Exception as e:
-            # Si no hay pydot/graphviz, crear una imagen de prueba simple
-            print(f"Graphviz no disponible, creando imagen de prueba: {e}")
+            # El arrastre no cambia la imagen, solo su posición: si la parte ya generada cubre
+            # lo visible basta con mover el ítem del canvas (un solo comando de Tk)
+            item = self._canvas_image_ids.get(panel)
+            vista_actual = self._vista_actual.get(panel)
+            if item is not None and vista_actual is not None and self._ventana_cubre(panel, vista_actual[1]):
+                getattr(self, f"canvas_{panel}").coords(item, *self._posicion_imagen(panel, vista_actual[1]))
+                return
+            
+            # Si no (zoom recortado que llegó al borde de su ventana), redibujar la imagen
+            # cuando Tk termine de procesar los eventos pendientes
+            if self._arrastre_after_id[panel] is None:
+                self._arrastre_after_id[panel] = self.root.after_idle(
+                    lambda: self._aplicar_arrastre_pendiente(panel))
+
+    def _aplicar_arrastre_pendiente(self, panel):
+        """Redibujar un panel con el offset acumulado por los eventos de arrastre"""
+        self._arrastre_after_id[panel] = None
+        self._redibujar_panel(panel)
+
+    def _probar_graphviz(self) -> bool:
+        """
+        Verificar una sola vez si se pueden generar gráficos con Graphviz
+
+        Returns:
+            True si el ejecutable 'dot' de Graphviz está en el PATH
+        """
+        if shutil.which('dot') is None:
+            log.warning("Graphviz ('dot') no está en el PATH, se usarán imágenes de prueba")
+            return False
+        return True
+
+    def _crear_grafico_automata(self, automata: Union[AFD, AFND]) -> "Image.Image":
+        """Crear gráfico de autómata con Graphviz"""
+        Image, _ = _pil()
+        if self._graphviz_ok is None:
+            self._graphviz_ok = self._probar_graphviz()
+        if not self._graphviz_ok:
+            # Si no está graphviz, crear una imagen de prueba simple
             return self._crear_imagen_prueba(automata)
 
-        # Código original para crear gráfico con pydot...
-        grafo = pydot.Dot(
-            graph_type='digraph',
-            rankdir='LR',
-            bgcolor='white',
-            dpi='96',
-            size='8,6',
-            ratio='compress',
-            fontname='Arial',
-            fontsize='11',
-            ranksep='0.5',
-            nodesep='0.4'
-        )
-        
-        # Configuración de estilo para nodos
-        grafo.set_node_defaults(
-            fontname='Arial',
-            fontsize='10',
-            style='filled',
-            fillcolor='lightblue',
-            penwidth='2'
-        )
-        
-        # Configuración de estilo para aristas
-        grafo.set_edge_defaults(
-            fontname='Arial',
-            fontsize='9',
-            arrowsize='0.8'
-        )
+        # El código DOT se arma directamente como texto: una línea por nodo y por arista,
+        # sin construir un objeto por cada uno
+        escala = 1 if _cairosvg() is not None else self.escala_render
+        lineas = [_ENCABEZADO_DOT, f'dpi={96 * escala};']
+        programa = 'sfdp' if len(automata.estados) > self.umbral_sfdp else 'dot'
+        if programa == 'sfdp':
+            lineas.append('overlap=scale;')
 
-        # Agregar nodo invisible para flecha inicial
-        nodo_inicio = pydot.Node('__start__', shape='none', label='', width='0', height='0')
-        grafo.add_node(nodo_inicio)
+        # Nodo invisible para la flecha inicial
+        lineas.append('__start__ [shape=none, label="", width=0, height=0];')
 
-        # Agregar nodos del autómata
+        # Nodos del autómata: doble círculo verde los finales, borde rojo el inicial
+        finales = frozenset(automata.estados_finales)
+        inicial = automata.estado_inicial
         for estado in automata.estados:
-            # Configurar estilo según tipo de estado
-            if estado in automata.estados_finales:
-                forma = 'doublecircle'
-                fillcolor = '#90EE90'  # Verde claro
+            nombre = _id_dot(estado)
+            if estado in finales:
+                estilo = 'shape=doublecircle, fillcolor="#90EE90"'  # Verde claro
             else:
-                forma = 'circle'
-                fillcolor = '#ADD8E6'  # Azul claro
-            
-            # Color especial para estado inicial
-            if estado == automata.estado_inicial:
-                pencolor = 'red'
-                penwidth = '3'
-            else:
-                pencolor = 'black'
-                penwidth = '2'
-            
-            nodo = pydot.Node(
-                str(estado),
-                shape=forma,
-                fillcolor=fillcolor,
-                color=pencolor,
-                penwidth=penwidth,
-                label=str(estado)
-            )
-            grafo.add_node(nodo)
-
-        # Agregar flecha al estado inicial
-        arista_inicial = pydot.Edge(
-            '__start__',
-            str(automata.estado_inicial),
-            color='red',
-            penwidth='2'
-        )
-        grafo.add_edge(arista_inicial)
+                estilo = 'shape=circle, fillcolor="#ADD8E6"'  # Azul claro
+            borde = 'color=red, penwidth=3' if estado == inicial else 'color=black, penwidth=2'
+            lineas.append(f'{nombre} [{estilo}, {borde}, label={nombre}];')
+
+        # Flecha al estado inicial
+        lineas.append(f'__start__ -> {_id_dot(inicial)} [color=red, penwidth=2];')
 
         # Agrupar transiciones por origen-destino
-        transiciones_agrupadas = {}
+        transiciones_agrupadas = defaultdict(list)
         for (estado_origen, simbolo), destinos in automata.transiciones.items():
-            if isinstance(destinos, str):
-                destinos = {destinos}
-            
-            for destino in destinos:
-                key = (estado_origen, destino)
-                if key not in transiciones_agrupadas:
-                    transiciones_agrupadas[key] = []
-                transiciones_agrupadas[key].append(simbolo)
+            # AFD: un destino (str); AFND: conjunto de destinos
+            for destino in ((destinos,) if isinstance(destinos, str) else destinos):
+                transiciones_agrupadas[(estado_origen, destino)].append(simbolo)
 
-        # Crear aristas con etiquetas agrupadas
+        # Aristas con etiquetas agrupadas (los auto-loops en azul real, el resto en gris oscuro)
         for (origen, destino), simbolos in transiciones_agrupadas.items():
-            # Unir símbolos con comas
             etiqueta = ', '.join(sorted(simbolos))
-            
-            # Estilo de arista
-            if origen == destino:
-                # Auto-loop
-                arista = pydot.Edge(
-                    str(origen),
-                    str(destino),
-                    label=etiqueta,
-                    color='#4169E1',  # Azul real
-                    fontcolor='#4169E1',
-                    penwidth='1.5'
-                )
-            else:
-                # Arista normal
-                arista = pydot.Edge(
-                    str(origen),
-                    str(destino),
-                    label=etiqueta,
-                    color='#696969',  # Gris oscuro
-                    fontcolor='black',
-                    penwidth='1.5'
-                )
-            grafo.add_edge(arista)
-
-        # Renderizar a PNG y convertir a PIL Image
-        png_bytes = grafo.create_png()
-        return Image.open(io.BytesIO(png_bytes))
+            estilo = _ESTILO_LOOP if origen == destino else _ESTILO_ARISTA
+            lineas.append(f'{_id_dot(origen)} -> {_id_dot(destino)} [label={_id_dot(etiqueta)}, {estilo}];')
+        lineas.append('}')
+
+        # Renderizar a PNG y convertir a PIL Image. Graphviz se invoca directamente por
+        # tuberías, y el resultado queda en el caché en disco para las próximas ejecuciones
+        fuente_dot = '\n'.join(lineas)
+        png_bytes = _renderizar_dot_cacheado(fuente_dot, 'png', programa)
+        imagen = Image.open(io.BytesIO(png_bytes))
+        imagen.info['escala'] = escala
+
+        # Con cairosvg disponible se guarda también el SVG: el redibujado final de cada
+        # zoom se rasteriza directamente al tamaño pedido en lugar de remuestrear el PNG
+        if _cairosvg() is not None:
+            try:
+                imagen.info['svg'] = _renderizar_dot_cacheado(fuente_dot, 'svg', programa)
+            except Exception as e:
+                log.debug("No se pudo generar el SVG: %s", e)
+        return imagen
 
     def _mostrar_estado(self, mensaje: str, tipo='normal'):
         """Mostrar mensaje en el área de texto con formato"""
-        # Configurar tags para diferentes tipos de mensajes
-        self.texto_estado.tag_config('normal', foreground='#ecf0f1')
-        self.texto_estado.tag_config('success', foreground='#2ecc71', font=('Consolas', 9, 'bold'))
-        self.texto_estado.tag_config('error', foreground='#e74c3c', font=('Consolas', 9, 'bold'))
-        self.texto_estado.tag_config('warning', foreground='#f39c12', font=('Consolas', 9, 'bold'))
-        self.texto_estado.tag_config('info', foreground='#3498db', font=('Consolas', 9, 'bold'))
-        self.texto_estado.tag_config('header', foreground='#9b59b6', font=('Consolas', 9, 'bold'))
-        
-        # Insertar mensaje con el tag correspondiente
-        self.texto_estado.insert(tk.END, mensaje, tipo)
+        self._mostrar_estados([(mensaje, tipo)])
+
+    def _mostrar_estados(self, segmentos):
+        """
+        Encolar varios mensajes para el área de texto
+
+        Los mensajes se muestran en _volcar_estado, que inserta todo lo acumulado de
+        una vez aunque lleguen muchos seguidos.
+
+        Args:
+            segmentos: Lista de tuplas (mensaje, tipo)
+        """
+        self._cola_estado.extend(segmentos)
+        if self._estado_after_id is None:
+            self._estado_after_id = self.root.after(self.estado_delay_ms, self._volcar_estado)
+
+    def _volcar_estado(self):
+        """Insertar los mensajes pendientes en el área de texto y recortar las líneas viejas"""
+        self._estado_after_id = None
+        # Text.insert acepta pares (texto, tag) consecutivos: un solo redibujado del widget
+        argumentos = [parte for mensaje, tipo in self._cola_estado for parte in (mensaje, tipo)]
+        self._cola_estado.clear()
+        if not argumentos:
+            return
+        self.texto_estado.configure(state=tk.NORMAL)
+        self.texto_estado.insert(tk.END, *argumentos)
+        lineas = int(self.texto_estado.index('end-1c').split('.')[0])
+        if lineas > self.max_lineas_estado:
+            self.texto_estado.delete('1.0', f'{lineas - self.max_lineas_estado + 1}.0')
+        self.texto_estado.configure(state=tk.DISABLED)
         self.texto_estado.see(tk.END)
 
     def _mostrar_validacion(self, validacion: Dict[str, Any]):
         """Mostrar resultados de validación con formato mejorado"""
-        self._mostrar_estado("\n📋 VALIDACIÓN DEL AUTÓMATA\n", 'header')
-        self._mostrar_estado("─" * 40 + "\n", 'normal')
+        segmentos = [
+            ("\n📋 VALIDACIÓN DEL AUTÓMATA\n", 'header'),
+            ("─" * 40 + "\n", 'normal'),
+        ]
         
         if validacion['es_valido']:
-            self._mostrar_estado("✅ Estado: VÁLIDO\n", 'success')
+            segmentos.append(("✅ Estado: VÁLIDO\n", 'success'))
         else:
-            self._mostrar_estado("❌ Estado: INVÁLIDO\n", 'error')
+            segmentos.append(("❌ Estado: INVÁLIDO\n", 'error'))
 
         if validacion["errores"]:
-            self._mostrar_estado("\n⚠️ Errores encontrados:\n", 'error')
-            for error in validacion["errores"]:
-                self._mostrar_estado(f"   • {error}\n", 'normal')
+            segmentos.append(("\n⚠️ Errores encontrados:\n", 'error'))
+            segmentos.append(("".join(f"   • {error}\n" for error in validacion["errores"]), 'normal'))
 
         if validacion["advertencias"]:
-            self._mostrar_estado("\n⚠️ Advertencias:\n", 'warning')
-            for adv in validacion["advertencias"]:
-                self._mostrar_estado(f"   • {adv}\n", 'normal')
+            segmentos.append(("\n⚠️ Advertencias:\n", 'warning'))
+            segmentos.append(("".join(f"   • {adv}\n" for adv in validacion["advertencias"]), 'normal'))
 
-        self._mostrar_estado("─" * 40 + "\n", 'normal')
+        segmentos.append(("─" * 40 + "\n", 'normal'))
+        self._mostrar_estados(segmentos)
 
 
 def main():
     """Función principal para iniciar la aplicación"""
+    # Los mensajes de depuración (p. ej. en cada evento de zoom) no se emiten por defecto
+    logging.basicConfig(level=logging.WARNING)
+
     # Configurar aspecto de la ventana principal
     root = tk.Tk()
     
@@ -1121,6 +1943,13 @@ def main():
     # Crear y ejecutar la aplicación
     app = GUIMinimizador(root)
     root.mainloop()
+    
+    # No esperar a renderizados pendientes al cerrar la ventana (cancel_futures
+    # existe desde Python 3.9; en 3.8 los pendientes terminan en segundo plano)
+    if sys.version_info >= (3, 9):
+        app._render_pool.shutdown(wait=False, cancel_futures=True)
+    else:
+        app._render_pool.shutdown(wait=False)
 
 
 if __name__ == "__main__":
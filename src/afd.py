@@ -1,6 +1,56 @@
-from typing import Dict, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from collections import deque  # Importar deque para mejorar la eficiencia
 
+
+def _recorrer_tabla(tabla: List[int], indice_simbolo: Dict[str, int], estado: int, cadena: str) -> int:
+    """
+    recorre la tabla compilada de un AFD consumiendo una cadena
+    
+    función de módulo sin acceso a atributos: todo lo que usa el bucle son variables locales,
+    y es el único punto a reemplazar si se quisiera un recorrido en código nativo
+    
+    Args:
+        tabla: tabla plana de transiciones (ver AFD.compilar)
+        indice_simbolo: columna de cada símbolo del alfabeto
+        estado: posición de la fila del estado de partida
+        cadena: cadena a consumir
+        
+    Returns:
+        posición de la fila del estado alcanzado, o -1 si la cadena tiene un símbolo
+        fuera del alfabeto
+    """
+    for simbolo in cadena:
+        columna = indice_simbolo.get(simbolo)
+        if columna is None:
+            return -1
+        estado = tabla[estado + columna]
+    return estado
+
+
+def _recorrer_bytes(tabla: List[int], lut: bytes, estado: int, datos: bytes) -> int:
+    """
+    variante de _recorrer_tabla para alfabetos de un byte: bytes.translate convierte toda la
+    cadena a columnas con la tabla de 256 posiciones (0xFF si no pertenece al alfabeto) en una
+    sola pasada en C, y la búsqueda de 0xFF también; el bucle de Python solo avanza estados
+    
+    Args:
+        tabla: tabla plana de transiciones (ver AFD.compilar)
+        lut: columna de cada byte, o 0xFF
+        estado: posición de la fila del estado de partida
+        datos: cadena codificada en latin-1
+        
+    Returns:
+        posición de la fila del estado alcanzado, o -1 si la cadena tiene un símbolo
+        fuera del alfabeto
+    """
+    columnas = datos.translate(lut)
+    if 0xFF in columnas:
+        return -1
+    for columna in columnas:
+        estado = tabla[estado + columna]
+    return estado
+
+
 class AFD:
     """
     Representa un automata finito deterministico
@@ -11,8 +61,19 @@ class AFD:
         transiciones: función de transición representada como diccionario
         estado_inicial: estado inicial del autómata
         estados_finales: conjunto de estados finales/de aceptación
+        KIND: etiqueta entera del tipo de autómata (0 = AFD, 1 = AFND)
     """
     
+    # etiqueta de tipo: permite despachar con una comparación de enteros en vez de isinstance
+    KIND: int = 0
+    
+    # atributos que definen al autómata: asignar cualquiera descarta la tabla compilada (ver __setattr__)
+    _ATRIBUTOS_DEFINICION = frozenset(("estados", "alfabeto", "transiciones", "estado_inicial",
+                                       "estados_finales"))
+    
+    # tabla de transiciones compilada (ver compilar); se construye la primera vez que se procesa una cadena
+    _tabla: Optional[Tuple[int, Dict[str, int], int, List[int], List[bool], List[str], Optional[bytes]]]
+    
     def __init__(self, 
                  estados: Set[str], 
                  alfabeto: Set[str], 
@@ -35,6 +96,21 @@ class AFD:
         self.estado_inicial = estado_inicial
         self.estados_finales = estados_finales
     
+    def __setattr__(self, nombre, valor):
+        """asignar uno de los atributos que definen al AFD descarta la tabla compilada"""
+        object.__setattr__(self, nombre, valor)
+        if nombre in self._ATRIBUTOS_DEFINICION:
+            self._invalidar()
+    
+    def _invalidar(self) -> None:
+        """
+        descarta la tabla compilada para que el próximo uso la vuelva a construir
+        
+        se llama sola al asignar estados, alfabeto, transiciones, estado inicial o estados
+        finales; quien modifique en el lugar uno de esos conjuntos o el diccionario de
+        transiciones tiene que llamarla después
+        """
+        self._tabla = None
     
     def es_completo(self) -> bool:
         """
@@ -43,6 +119,12 @@ class AFD:
         Returns:
             true si es completo, false en caso contrario
         """
+        # las claves de transiciones son únicas: con menos de |Q|·|Σ| no pueden cubrir todos los
+        # pares. con igual o más cantidad puede haber claves ajenas (estados o símbolos que no
+        # están en el autómata), así que hay que revisar los pares
+        if len(self.transiciones) < len(self.estados) * len(self.alfabeto):
+            return False
+        
         # para cada estado en el autómata
         for estado in self.estados:
             # para cada símbolo del alfabeto
@@ -55,6 +137,60 @@ class AFD:
         
         return True
     
+    def compilar(self) -> None:
+        """
+        compila la función de transición a una tabla densa indexada por enteros
+        
+        cada estado y cada símbolo del alfabeto reciben un índice; la tabla es una única
+        lista plana donde la fila de cada estado ocupa `paso` posiciones consecutivas
+        (paso = |Σ|, o 1 si el alfabeto está vacío). cada celda guarda directamente la
+        posición de la fila destino (índice destino * paso), así avanzar un símbolo es
+        tabla[estado + columna] sin multiplicar. las transiciones que faltan van a una fila
+        extra, la del estado "muerto", que vuelve siempre a sí misma y no es final: el
+        recorrido no necesita comprobar en cada paso si la transición existe.
+        
+        además un vector indica qué índices son finales y otro da el nombre de cada índice
+        (los de self.estados ocupan los primeros lugares). si todos los símbolos son
+        caracteres de un byte (latin-1) se arma también una tabla de 256 posiciones
+        byte -> columna para recorrer la cadena codificada.
+        procesar_cadena la construye sola la primera vez, y reasignar un atributo del AFD
+        la descarta (ver _invalidar) para que se vuelva a construir en el próximo uso.
+        """
+        # asignar un índice a cada estado (incluye estados que solo aparecen en transiciones)
+        indices: Dict[str, int] = {}
+        for estado in (self.estado_inicial, *self.estados):
+            indices.setdefault(estado, len(indices))
+        for (origen, _), destino in self.transiciones.items():
+            indices.setdefault(origen, len(indices))
+            indices.setdefault(destino, len(indices))
+        
+        # índice de cada símbolo del alfabeto (orden fijo para que la tabla sea reproducible)
+        indice_simbolo = {simbolo: i for i, simbolo in enumerate(sorted(self.alfabeto))}
+        paso = max(len(indice_simbolo), 1)
+        
+        # tabla plana con una fila por estado más la del estado muerto (la última)
+        muerto = len(indices) * paso
+        tabla = [muerto] * (muerto + paso)
+        for (origen, simbolo), destino in self.transiciones.items():
+            columna = indice_simbolo.get(simbolo)
+            if columna is not None:
+                tabla[indices[origen] * paso + columna] = indices[destino] * paso
+        
+        finales = [estado in self.estados_finales for estado in indices]
+        finales.append(False)  # estado muerto
+        
+        # byte -> columna (0xFF = fuera del alfabeto), si el alfabeto entra en un byte por símbolo
+        lut = None
+        if len(indice_simbolo) < 0xFF and all(len(simbolo) == 1 and ord(simbolo) < 256
+                                              for simbolo in indice_simbolo):
+            mapa = bytearray(b'\xff' * 256)
+            for simbolo, columna in indice_simbolo.items():
+                mapa[ord(simbolo)] = columna
+            lut = bytes(mapa)  # inmutable: se comparte entre todas las cadenas procesadas
+        
+        self._tabla = (indices[self.estado_inicial] * paso, indice_simbolo, paso, tabla, finales,
+                       list(indices), lut)
+    
     def procesar_cadena(self, cadena: str) -> bool:
         """
         procesa una cadena y determina si es aceptada por el autómata
@@ -65,29 +201,54 @@ class AFD:
         Returns:
             true si la cadena es aceptada, false en caso contrario
         """
-        # comenzar en el estado inicial
-        estado_actual = self.estado_inicial
+        if self._tabla is None:
+            self.compilar()
+        datos = self.codificar(cadena) if self._tabla[6] is not None else None
+        return self.procesar_codificada(cadena, datos)
+    
+    @staticmethod
+    def codificar(cadena: str) -> Optional[bytes]:
+        """
+        codifica una cadena para procesar_codificada
         
-        # procesar cada símbolo de la cadena uno por uno
-        for simbolo in cadena:
-            # verificar si el símbolo está en el alfabeto
-            if simbolo not in self.alfabeto:
-                # si el símbolo no está en el alfabeto, rechazar
-                return False
-            
-            # buscar la transición desde el estado actual con este símbolo
-            transicion = (estado_actual, simbolo)
+        Args:
+            cadena: cadena a codificar
             
-            # verificar si existe la transición
-            if transicion not in self.transiciones:
-                # si no hay transición definida, rechazar
-                return False
+        Returns:
+            la cadena en latin-1, o None si tiene caracteres fuera de latin-1
+        """
+        try:
+            return cadena.encode('latin-1')
+        except UnicodeEncodeError:
+            return None
+    
+    def procesar_codificada(self, cadena: str, datos: Optional[bytes]) -> bool:
+        """
+        igual que procesar_cadena, pero con la cadena ya codificada: al probar la misma cadena
+        en varios AFD se codifica una sola vez (ver Automata.procesar_cadena_lote)
+        
+        Args:
+            cadena: cadena a procesar
+            datos: resultado de codificar(cadena)
             
-            # ir al siguiente estado
-            estado_actual = self.transiciones[transicion]
+        Returns:
+            true si la cadena es aceptada, false en caso contrario
+        """
+        if self._tabla is None:
+            self.compilar()
+        estado_inicial, indice_simbolo, paso, tabla, finales, _, lut = self._tabla
+        
+        # procesar cada símbolo: un símbolo fuera del alfabeto rechaza la cadena, y una
+        # transición no definida lleva al estado muerto (no final)
+        if lut is not None:
+            if datos is None:
+                return False  # hay caracteres que no pueden estar en un alfabeto de un byte
+            estado_actual = _recorrer_bytes(tabla, lut, estado_inicial, datos)
+        else:
+            estado_actual = _recorrer_tabla(tabla, indice_simbolo, estado_inicial, cadena)
         
         # por ultimo, verificar si el estado actual es un estado final
-        return estado_actual in self.estados_finales
+        return estado_actual >= 0 and finales[estado_actual // paso]
     
     def obtener_estados_alcanzables(self) -> Set[str]:
         """
@@ -99,41 +260,45 @@ class AFD:
         if self.estado_inicial not in self.estados:
             raise ValueError("El estado inicial no pertenece al conjunto de estados")
         
-        # conjunto para almacenar los estados visitados
-        estados_alcanzables = set()
+        if self._tabla is None:
+            self.compilar()
+        estado_inicial, indice_simbolo, paso, tabla, _, nombres, _ = self._tabla
+        simbolos = list(indice_simbolo)
+        n_validos = len(self.estados)  # índices mayores: estados que solo aparecen en transiciones
+        muerto = len(nombres) * paso
         
-        # cola de estados por explorar (comienza desde estado inicial) usando deque para eficiencia
-        estados_por_explorar = deque([self.estado_inicial])
+        # BFS sobre la tabla compilada: los estados son índices y los visitados un bytearray
+        estado_inicial //= paso
+        visitados = bytearray(len(nombres))
+        visitados[estado_inicial] = 1
+        estados_por_explorar = deque([estado_inicial])
         
         # mientras haya estados por explorar
         while estados_por_explorar:
             # tomar el siguiente estado de la cola (O(1) con deque)
             estado_actual = estados_por_explorar.popleft()
             
-            # marcar este estado como visitado (la verificación redundante se elimina porque solo agregamos no visitados)
-            if estado_actual in estados_alcanzables:
-                continue  # En caso de que se agregue por error, pero no debería ocurrir
-            
-            estados_alcanzables.add(estado_actual)
-            
-            # explorar todas las transiciones desde este estado
-            for simbolo in self.alfabeto:
-                transicion = (estado_actual, simbolo)
+            # explorar la fila del estado: una transición por símbolo del alfabeto
+            inicio_fila = estado_actual * paso
+            for columna, simbolo in enumerate(simbolos):
+                fila_destino = tabla[inicio_fila + columna]
                 
-                # si existe una transición con este símbolo
-                if transicion in self.transiciones:
-                    estado_destino = self.transiciones[transicion]
-                    
-                    # validar que el estado destino pertenece a los estados (robustez)
-                    if estado_destino not in self.estados:
-                        raise ValueError(f"El estado destino {estado_destino} no pertenece al conjunto de estados")
-                    
-                    # si el estado destino no ha sido visitado, agregarlo a la cola
-                    if estado_destino not in estados_alcanzables:
-                        estados_por_explorar.append(estado_destino)
-                else:
-                    print(f"Advertencia: No hay transición desde {estado_actual} con símbolo {simbolo}")
-                    pass
+                if fila_destino == muerto:
+                    print(f"Advertencia: No hay transición desde {nombres[estado_actual]} con símbolo {simbolo}")
+                    continue
+                estado_destino = fila_destino // paso
+                
+                # validar que el estado destino pertenece a los estados (robustez)
+                if estado_destino >= n_validos:
+                    raise ValueError(f"El estado destino {nombres[estado_destino]} no pertenece al conjunto de estados")
+                
+                # si el estado destino no ha sido visitado, marcarlo y agregarlo a la cola
+                if not visitados[estado_destino]:
+                    visitados[estado_destino] = 1
+                    estados_por_explorar.append(estado_destino)
+        
+        # convertir los índices visitados a nombres de estados
+        estados_alcanzables = {nombres[i] for i in range(len(nombres)) if visitados[i]}
         
         return estados_alcanzables
     
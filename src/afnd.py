@@ -1,9 +1,13 @@
 """
 Clase para representar un Autómata Finito No Determinístico (AFND)
 """
-from typing import Dict, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 from collections import deque  # Importar deque para mejorar la eficiencia
 
+# Símbolos que representan una transición lambda
+SIMBOLOS_LAMBDA = frozenset(("lambda", "λ", ""))
+
+
 class AFND:
     """
     Representa un Autómata Finito No Determinístico
@@ -14,8 +18,32 @@ class AFND:
         transiciones: Función de transición representada como diccionario
         estado_inicial: Estado inicial del autómata
         estados_finales: Conjunto de estados finales/de aceptación
+        KIND: Etiqueta entera del tipo de autómata (0 = AFD, 1 = AFND)
     """
     
+    # Etiqueta de tipo: permite despachar con una comparación de enteros en vez de isinstance
+    KIND: int = 1
+    
+    # Atributos que definen al autómata: asignar cualquiera descarta las estructuras
+    # compiladas (ver __setattr__)
+    _ATRIBUTOS_DEFINICION = frozenset(("estados", "alfabeto", "transiciones", "estado_inicial",
+                                       "estados_finales"))
+    
+    # Transiciones agrupadas por estado de origen: origen -> {símbolo: destinos} (ver compilar)
+    _por_origen: Optional[Dict[str, Dict[str, Set[str]]]] = None
+    
+    # Transiciones lambda agrupadas por origen: origen -> destinos (ver compilar)
+    _adyacencia_lambda: Optional[Dict[str, Set[str]]] = None
+    
+    # Clausura lambda de cada estado (ver compilar); se calcula la primera vez que se pide
+    _clausuras: Optional[Dict[str, FrozenSet[str]]] = None
+    
+    # Simulación con conjuntos de estados como máscaras de bits (ver _compilar_mascaras):
+    # (nombre de cada bit, bit de cada estado, símbolo -> [máscara destino por bit],
+    # [máscara de la clausura por bit], máscara de finales); las entradas None se calculan al usarlas
+    _mascaras: Optional[Tuple[List[str], Dict[str, int], Dict[str, List[Optional[int]]],
+                              List[Optional[int]], int]] = None
+    
     def __init__(self, 
                  estados: Set[str], 
                  alfabeto: Set[str], 
@@ -38,6 +66,25 @@ class AFND:
         self.estado_inicial = estado_inicial
         self.estados_finales = estados_finales
     
+    def __setattr__(self, nombre, valor):
+        """Asignar uno de los atributos que definen al AFND descarta las estructuras compiladas"""
+        object.__setattr__(self, nombre, valor)
+        if nombre in self._ATRIBUTOS_DEFINICION:
+            self._invalidar()
+    
+    def _invalidar(self) -> None:
+        """
+        Descarta las estructuras armadas por compilar; el próximo uso vuelve a compilar
+        
+        Se llama sola al asignar estados, alfabeto, transiciones, estado inicial o
+        estados finales; quien modifique en el lugar uno de esos conjuntos, el diccionario
+        de transiciones o un conjunto de destinos tiene que llamarla después.
+        """
+        self._por_origen = None
+        self._adyacencia_lambda = None
+        self._clausuras = None
+        self._mascaras = None
+    
     def tiene_transiciones_lambda(self) -> bool:
         """
         Verifica si el AFND tiene transiciones lambda (λ-transiciones)
@@ -45,13 +92,143 @@ class AFND:
         Returns:
             True si tiene transiciones lambda, False en caso contrario
         """
-        # Recorrer todas las transiciones
-        for estado_origen, simbolo in self.transiciones:
-            # Verificar si el símbolo es lambda
-            if simbolo == "lambda" or simbolo == "λ" or simbolo == "":
-                return True
+        # Los orígenes con transiciones lambda quedan registrados al compilar
+        if self._por_origen is None:
+            self.compilar()
+        return bool(self._adyacencia_lambda)
+    
+    def compilar(self) -> None:
+        """
+        Prepara las estructuras derivadas de las transiciones
+        
+        En una sola pasada las transiciones se agrupan por estado de origen
+        (origen -> {símbolo: destinos}), así cada paso de una simulación hace una búsqueda
+        por estado activo, y las transiciones lambda se juntan aparte por origen. La
+        clausura de cada estado se calcula la primera vez que se pide y queda guardada.
+        Los métodos que las usan llaman a este método la primera vez, y reasignar un
+        atributo del AFND las descarta (ver _invalidar).
+        """
+        por_origen: Dict[str, Dict[str, Set[str]]] = {}
+        adyacencia: Dict[str, Set[str]] = {}
+        for (origen, simbolo), destinos in self.transiciones.items():
+            por_origen.setdefault(origen, {})[simbolo] = destinos
+            if simbolo in SIMBOLOS_LAMBDA:
+                adyacencia.setdefault(origen, set()).update(destinos)
+        self._por_origen = por_origen
+        self._adyacencia_lambda = adyacencia
+        self._clausuras = {}
+        self._mascaras = None
+    
+    def _compilar_mascaras(self) -> Tuple[List[str], Dict[str, int], Dict[str, List[Optional[int]]],
+                                          List[Optional[int]], int]:
+        """
+        Arma las tablas para simular el AFND con conjuntos de estados como enteros
         
-        return False
+        Cada estado recibe un número de bit y un conjunto de estados es la suma de sus bits.
+        Para cada símbolo y estado se guarda la máscara de la clausura lambda de sus destinos:
+        como la clausura de una unión es la unión de las clausuras, un paso de la simulación
+        es un OR de una entrada por estado activo. Las entradas empiezan en None y se
+        completan la primera vez que la simulación las usa (ver _mascara_paso), a partir de
+        las clausuras memorizadas de _clausura_estado.
+        
+        Returns:
+            (nombre de cada bit, bit de cada estado, símbolo -> lista de máscaras indexada
+            por bit del estado, máscara de la clausura de cada bit, máscara de los estados
+            finales)
+        """
+        # Número de bit de cada estado (incluye los que solo aparecen como origen)
+        nombres = list(dict.fromkeys((self.estado_inicial, *self.estados, *self._por_origen)))
+        bits = {estado: bit for bit, estado in enumerate(nombres)}
+        
+        pasos: Dict[str, List[Optional[int]]] = {simbolo: [None] * len(nombres)
+                                                 for simbolo in self.alfabeto}
+        clausuras: List[Optional[int]] = [None] * len(nombres)
+        
+        finales = 0
+        for estado in self.estados_finales:
+            if estado in bits:
+                finales |= 1 << bits[estado]
+        return nombres, bits, pasos, clausuras, finales
+    
+    def _mascara_clausura(self, bit: int) -> int:
+        """
+        Máscara de la clausura lambda del estado de un bit (se calcula una sola vez)
+        
+        Raises:
+            ValueError: Si la clausura llega a un estado que no pertenece al autómata
+        """
+        nombres, bits, _, clausuras, _ = self._mascaras
+        mascara = clausuras[bit]
+        if mascara is None:
+            mascara = 0
+            for estado in self._clausura_estado(nombres[bit]):
+                mascara |= 1 << bits[estado]
+            clausuras[bit] = mascara
+        return mascara
+    
+    def _mascara_paso(self, simbolo: str, bit: int) -> int:
+        """
+        Máscara de los estados alcanzados desde el estado de un bit leyendo un símbolo
+        (clausura lambda incluida); se calcula una sola vez
+        
+        Raises:
+            ValueError: Si la transición lleva a un estado que no pertenece al autómata
+        """
+        nombres, bits, pasos, _, _ = self._mascaras
+        destinos = self._por_origen.get(nombres[bit], {}).get(simbolo)
+        mascara = 0
+        if destinos:
+            self._validar_destinos(destinos)
+            for estado in destinos:
+                mascara |= self._mascara_clausura(bits[estado])
+        pasos[simbolo][bit] = mascara
+        return mascara
+    
+    def _validar_destinos(self, destinos: Set[str]) -> None:
+        """
+        Verifica que un conjunto de destinos pertenezca al conjunto de estados
+        
+        Raises:
+            ValueError: Si algún destino no es un estado del autómata
+        """
+        if not destinos <= self.estados:
+            destino = next(iter(destinos - self.estados))
+            raise ValueError(f"El estado destino {destino} no pertenece al conjunto de estados")
+    
+    def _clausura_estado(self, estado: str) -> FrozenSet[str]:
+        """
+        Calcula (o recupera) la clausura lambda de un solo estado
+        
+        Args:
+            estado: Estado de partida
+            
+        Returns:
+            Conjunto inmutable con el estado y los alcanzables por transiciones lambda
+        """
+        clausura = self._clausuras.get(estado)
+        if clausura is not None:
+            return clausura
+        
+        adyacencia = self._adyacencia_lambda
+        alcanzados = {estado}
+        por_procesar = [estado]
+        while por_procesar:
+            for destino in adyacencia.get(por_procesar.pop(), ()):
+                if destino not in self.estados:
+                    raise ValueError(f"El estado destino {destino} no pertenece al conjunto de estados")
+                if destino in alcanzados:
+                    continue
+                # Si la clausura del destino ya se conoce se agrega entera, sin recorrerla
+                conocida = self._clausuras.get(destino)
+                if conocida is not None:
+                    alcanzados |= conocida
+                else:
+                    alcanzados.add(destino)
+                    por_procesar.append(destino)
+        
+        clausura = frozenset(alcanzados)
+        self._clausuras[estado] = clausura
+        return clausura
     
     def clausura_lambda(self, estados: Set[str]) -> Set[str]:
         """
@@ -59,6 +236,7 @@ class AFND:
         
         La clausura lambda incluye todos los estados alcanzables
         desde los estados dados usando solo transiciones lambda.
+        Es la unión de las clausuras de cada estado, que se calculan una sola vez.
         
         Args:
             estados: Conjunto de estados inicial
@@ -66,27 +244,12 @@ class AFND:
         Returns:
             Clausura lambda del conjunto de estados
         """
-        # Crear una copia del conjunto inicial
-        clausura = set(estados)
-        
-        # Cola de estados por procesar (usando deque para BFS eficiente)
-        por_procesar = deque(estados)
-        
-        # Procesar hasta que no haya más estados que agregar
-        while por_procesar:
-            estado_actual = por_procesar.popleft()
-            
-            # Buscar transiciones lambda desde este estado
-            for (origen, simbolo), destinos in self.transiciones.items():
-                if origen == estado_actual and (simbolo == "lambda" or simbolo == "λ" or simbolo == ""):
-                    # Agregar estados destino que no estén ya en la clausura
-                    for destino in destinos:
-                        if destino not in self.estados:
-                            raise ValueError(f"El estado destino {destino} no pertenece al conjunto de estados")
-                        if destino not in clausura:
-                            clausura.add(destino)
-                            por_procesar.append(destino)
+        if self._por_origen is None:
+            self.compilar()
         
+        clausura = set()
+        for estado in estados:
+            clausura |= self._clausura_estado(estado)
         return clausura
     
     def procesar_cadena(self, cadena: str) -> bool:
@@ -99,46 +262,53 @@ class AFND:
         Returns:
             True si la cadena es aceptada, False en caso contrario
         """
-        # Empezar con la clausura lambda del estado inicial
-        estados_actuales = self.clausura_lambda({self.estado_inicial})
+        if self._por_origen is None:
+            self.compilar()
+        if self._mascaras is None:
+            self._mascaras = self._compilar_mascaras()
+        return self._procesar_con_mascaras(cadena)
+    
+    def _procesar_con_mascaras(self, cadena: str) -> bool:
+        """
+        procesar_cadena con los conjuntos de estados representados como máscaras de bits
+        
+        Args:
+            cadena: Cadena a procesar
+            
+        Returns:
+            True si la cadena es aceptada, False en caso contrario
+        """
+        _, bits, pasos, _, finales = self._mascaras
+        estados_actuales = self._mascara_clausura(bits[self.estado_inicial])
         
-        # Procesar cada símbolo de la cadena
         for simbolo in cadena:
-            # Verificar que el símbolo esté en el alfabeto
-            if simbolo not in self.alfabeto:
+            # Solo los símbolos del alfabeto tienen fila
+            fila = pasos.get(simbolo)
+            if fila is None:
                 return False
             
-            # Conjunto de nuevos estados después de leer el símbolo
-            nuevos_estados = set()
-            
-            # Para cada estado actual, buscar transiciones con este símbolo
-            for estado in estados_actuales:
-                if (estado, simbolo) in self.transiciones:
-                    # Agregar todos los estados destino
-                    for dest in self.transiciones[(estado, simbolo)]:
-                        if dest not in self.estados:
-                            raise ValueError(f"El estado destino {dest} no pertenece al conjunto de estados")
-                        nuevos_estados.add(dest)
-            
-            # Calcular la clausura lambda de los nuevos estados
-            estados_actuales = self.clausura_lambda(nuevos_estados)
+            # OR de la fila de cada estado activo, tomando el bit más bajo en cada vuelta
+            nuevos_estados = 0
+            while estados_actuales:
+                bit = estados_actuales & -estados_actuales
+                estados_actuales ^= bit
+                bit = bit.bit_length() - 1
+                paso = fila[bit]
+                if paso is None:
+                    paso = self._mascara_paso(simbolo, bit)
+                nuevos_estados |= paso
             
-            # Si no hay estados actuales, la cadena es rechazada
-            if not estados_actuales:
+            if not nuevos_estados:
                 return False
+            estados_actuales = nuevos_estados
         
-        # Verificar si algún estado actual es final
-        for estado in estados_actuales:
-            if estado in self.estados_finales:
-                return True
-        
-        # Si llegamos aquí, no hay estados finales en el conjunto actual
-        return False
+        return bool(estados_actuales & finales)
     
     def obtener_estados_alcanzables(self) -> Set[str]:
         """
         Obtiene el conjunto de estados alcanzables desde el estado inicial
-        siguiendo solo transiciones válidas (simulación BFS sobre configuraciones).
+        siguiendo solo transiciones válidas (BFS sobre estados, cerrando cada
+        estado nuevo por sus transiciones lambda).
         
         Returns:
             Conjunto de estados alcanzables
@@ -146,33 +316,26 @@ class AFND:
         if self.estado_inicial not in self.estados:
             raise ValueError("El estado inicial no pertenece al conjunto de estados")
         
-        alcanzados = set()
-        # Cola de configuraciones: (conjunto de estados actuales) usando deque para eficiencia
-        cola = deque([self.clausura_lambda({self.estado_inicial})])
+        if self._por_origen is None:
+            self.compilar()
+        por_origen = self._por_origen
+        sin_transiciones: Dict[str, Set[str]] = {}
+        
+        alcanzados = self.clausura_lambda({self.estado_inicial})
+        # Cola de estados por explorar (usando deque para eficiencia)
+        cola = deque(alcanzados)
         
         while cola:
-            estados_actuales = cola.popleft()
+            estado_actual = cola.popleft()
             
-            # Agregar nuevos estados a alcanzados
-            for estado in estados_actuales:
-                if estado not in alcanzados:
-                    alcanzados.add(estado)
-            
-            # Para cada símbolo del alfabeto, simular transición
-            for simbolo in self.alfabeto:
-                nuevos_estados = set()
-                for estado in estados_actuales:
-                    if (estado, simbolo) in self.transiciones:
-                        for dest in self.transiciones[(estado, simbolo)]:
-                            if dest not in self.estados:
-                                raise ValueError(f"El estado destino {dest} no pertenece al conjunto de estados")
-                            nuevos_estados.add(dest)
-                
-                if nuevos_estados:
-                    clausura_nuevos = self.clausura_lambda(nuevos_estados)
-                    # Solo agregar si hay algún estado nuevo
-                    if not clausura_nuevos.issubset(alcanzados):
-                        cola.append(clausura_nuevos)
+            # Solo las transiciones que salen de este estado, con símbolos del alfabeto
+            for simbolo, destinos in por_origen.get(estado_actual, sin_transiciones).items():
+                if simbolo not in self.alfabeto or not destinos:
+                    continue
+                self._validar_destinos(destinos)
+                nuevos = self.clausura_lambda(destinos) - alcanzados
+                alcanzados |= nuevos
+                cola.extend(nuevos)
         
         return alcanzados
     
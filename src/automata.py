@@ -1,7 +1,7 @@
 """
 Clase principal para coordinar todas las operaciones del minimizador
 """
-from typing import Dict, Union, List
+from typing import Any, Dict, Optional, Union, List
 try:
     from .afd import AFD
     from .afnd import AFND
@@ -26,17 +26,22 @@ class Automata:
         self.automata_actual = None
         self.historial_operaciones = []
     
-    def cargar(self, ruta_archivo: str) -> Union[AFD, AFND]:
+    def cargar(self, ruta_archivo: str, datos: Optional[Dict[str, Any]] = None) -> Union[AFD, AFND]:
         """
         Carga un autómata desde un archivo JSON
         
         Args:
             ruta_archivo: Ruta al archivo JSON
+            datos: Contenido del archivo si ya fue leído (con ManejadorArchivos.leer_json),
+                   para no volver a leerlo
             
         Returns:
             Autómata cargado (AFD o AFND)
         """
-        automata = ManejadorArchivos.leer_automata(ruta_archivo)
+        if datos is None:
+            automata = ManejadorArchivos.leer_automata(ruta_archivo)
+        else:
+            automata = ManejadorArchivos.crear_automata(datos)
         self.automata_actual = automata
         self._agregar_operacion("cargar", f"Cargado desde {ruta_archivo}")
         return automata
@@ -86,6 +91,25 @@ class Automata:
         self._agregar_operacion("minimizacion", f"AFD minimizado: {estadisticas}")
         return afd_minimizado
     
+    def procesar_cadena_lote(self, cadena: str, automatas: List[Union[AFD, AFND]]) -> List[bool]:
+        """
+        Procesa una misma cadena con varios autómatas
+        
+        La cadena se codifica una sola vez para todos los AFD (ver AFD.procesar_codificada);
+        los AFND la procesan con su propio procesar_cadena.
+        
+        Args:
+            cadena: Cadena a procesar
+            automatas: Autómatas con los que probarla
+            
+        Returns:
+            Lista con el resultado de cada autómata, en el mismo orden
+        """
+        datos = AFD.codificar(cadena)
+        return [automata.procesar_codificada(cadena, datos) if automata.KIND == AFD.KIND
+                else automata.procesar_cadena(cadena)
+                for automata in automatas]
+    
     def procesar_automata_completo(self, ruta_entrada: str, 
                                   ruta_salida: str,
                                   forzar_conversion: bool = False) -> Dict:
@@ -113,7 +137,7 @@ class Automata:
             resultado["operaciones_realizadas"].append("carga")
             
             # 2. Convertir a AFD si es necesario
-            if isinstance(automata_original, AFND):
+            if automata_original.KIND == AFND.KIND:
                 afd = self.convertir_afnd_a_afd(automata_original)
                 resultado["operaciones_realizadas"].append("conversion")
             else:
@@ -159,7 +183,7 @@ class Automata:
         }
         
         # Determinar tipo de autómata
-        es_afd = isinstance(automata, AFD)
+        es_afd = automata.KIND == AFD.KIND
         tipo_automata = "AFD" if es_afd else "AFND"
         
         # 1. Validar estados básicos
@@ -288,6 +312,14 @@ class Automata:
         """
         from collections import deque
         
+        # Agrupar los destinos por estado de origen en una sola pasada (solo símbolos del
+        # alfabeto), así cada estado explorado hace una búsqueda en lugar de una por símbolo
+        sucesores: Dict[str, List] = {}
+        for (origen, simbolo), destinos in automata.transiciones.items():
+            if simbolo in automata.alfabeto:
+                # AFD: un destino (str); AFND: conjunto de destinos
+                sucesores.setdefault(origen, []).append((destinos,) if isinstance(destinos, str) else destinos)
+        
         alcanzables = set()
         cola = deque([automata.estado_inicial])
         alcanzables.add(automata.estado_inicial)
@@ -296,19 +328,11 @@ class Automata:
             estado_actual = cola.popleft()
             
             # Explorar transiciones desde el estado actual
-            for simbolo in automata.alfabeto:
-                clave = (estado_actual, simbolo)
-                if clave in automata.transiciones:
-                    destinos = automata.transiciones[clave]
-                    
-                    if isinstance(destinos, str):
-                        # AFD
-                        destinos = {destinos}
-                    
-                    for destino in destinos:
-                        if destino not in alcanzables:
-                            alcanzables.add(destino)
-                            cola.append(destino)
+            for destinos in sucesores.get(estado_actual, ()):
+                for destino in destinos:
+                    if destino not in alcanzables:
+                        alcanzables.add(destino)
+                        cola.append(destino)
         
         return alcanzables
     
@@ -323,7 +347,7 @@ class Automata:
             Diccionario con estadísticas
         """
         estadisticas = {
-            "tipo": "AFD" if isinstance(automata, AFD) else "AFND",
+            "tipo": "AFD" if automata.KIND == AFD.KIND else "AFND",
             "num_estados": len(automata.estados),
             "num_simbolos": len(automata.alfabeto),
             "num_transiciones": len(automata.transiciones),
@@ -1,7 +1,8 @@
 """
 Clase para convertir AFND a AFD
 """
-from typing import Dict, Set
+from collections import deque
+from typing import Dict, FrozenSet, Set
 try:
     from .afd import AFD
     from .afnd import AFND
@@ -194,15 +195,22 @@ class ConversorAFND:
         self.estados_afd[frozenset(estado_inicial_afnd)] = estado_inicial_afd
         
         # Cola de estados por procesar (conjuntos de estados AFND)
-        por_procesar = [frozenset(estado_inicial_afnd)]
+        por_procesar = deque([frozenset(estado_inicial_afnd)])
         procesados = set()
         
         # Diccionario para construir transiciones del AFD: (estado_afd, simbolo) -> estado_afd_destino
         transiciones_afd = {}
         
+        # Dentro del bucle mover y la clausura se calculan sin repetir en cada paso las
+        # validaciones de mover() y clausura_epsilon_conjunto(): los destinos se validan una
+        # vez por conjunto, junto con su clausura, que se memoriza porque el mismo conjunto
+        # destino aparece muchas veces
+        transiciones_afnd = self.afnd.transiciones
+        clausuras: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        
         # Paso 2: Construir todos los estados del AFD
         while por_procesar:
-            conjunto_actual = por_procesar.pop(0)
+            conjunto_actual = por_procesar.popleft()
             
             # Evitar procesar el mismo conjunto múltiples veces
             if conjunto_actual in procesados:
@@ -214,10 +222,22 @@ class ConversorAFND:
             # Para cada símbolo del alfabeto
             for simbolo in self.afnd.alfabeto:
                 # Calcular mover(conjunto_actual, simbolo)
-                estados_mover = self.mover(set(conjunto_actual), simbolo)
+                estados_mover = set()
+                for estado in conjunto_actual:
+                    destinos = transiciones_afnd.get((estado, simbolo))
+                    if destinos:
+                        estados_mover.update(destinos)
+                estados_mover = frozenset(estados_mover)
                 
                 # Calcular clausura epsilon del resultado
-                conjunto_destino = frozenset(self.clausura_epsilon_conjunto(estados_mover))
+                conjunto_destino = clausuras.get(estados_mover)
+                if conjunto_destino is None:
+                    # Misma validación que clausura_epsilon_conjunto, una vez por conjunto
+                    estados_invalidos = estados_mover - self.afnd.estados
+                    if estados_invalidos:
+                        raise ValueError(f"Estados no válidos en el AFND: {set(estados_invalidos)}")
+                    conjunto_destino = frozenset(self.afnd.clausura_lambda(estados_mover)) if estados_mover else frozenset()
+                    clausuras[estados_mover] = conjunto_destino
                 
                 # Si el conjunto destino no está vacío o es nuevo
                 if conjunto_destino not in self.estados_afd:
@@ -242,20 +262,14 @@ class ConversorAFND:
             if conjunto & self.afnd.estados_finales:
                 estados_finales_afd.add(nombre_estado)
         
-        # Paso 4: Crear y retornar el AFD
-        # Convertir transiciones a formato esperado por AFD
-        transiciones_afd_dict = {}
-        for (estado_origen, simbolo), estado_destino in transiciones_afd.items():
-            if (estado_origen, simbolo) not in transiciones_afd_dict:
-                transiciones_afd_dict[(estado_origen, simbolo)] = estado_destino
-        
+        # Paso 4: Crear y retornar el AFD (transiciones_afd ya tiene el formato esperado por AFD)
         # Crear conjunto de estados del AFD
         estados_afd_final = set(self.estados_afd.values())
         
         return AFD(
             estados=estados_afd_final,
             alfabeto=self.afnd.alfabeto.copy(),
-            transiciones=transiciones_afd_dict,
+            transiciones=transiciones_afd,
             estado_inicial=estado_inicial_afd,
             estados_finales=estados_finales_afd
         )
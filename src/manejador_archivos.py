@@ -3,7 +3,7 @@ Clase para manejar la lectura y escritura de archivos JSON de autómatas
 """
 import json
 import os
-from typing import Dict, Union, List
+from typing import Any, Dict, Union, List
 try:
     from .afd import AFD
     from .afnd import AFND
@@ -11,6 +11,12 @@ except ImportError:
     from afd import AFD
     from afnd import AFND
 
+# orjson es opcional: si está instalado se usa para leer los archivos (parsea en código nativo)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ManejadorArchivos:
     """
@@ -37,23 +43,57 @@ class ManejadorArchivos:
             raise FileNotFoundError(f"El archivo {ruta_archivo} no existe")
         
         try:
-            with open(ruta_archivo, 'r', encoding='utf-8') as archivo:
-                data = json.load(archivo)
-            
-            # Validar estructura básica
-            ManejadorArchivos._validar_estructura_json(data)
-            
-            # Crear autómata según el tipo
-            tipo = data.get("tipo", "AFD")
-            if tipo == "AFD":
-                return AFD.from_dict(data)
-            elif tipo == "AFND":
-                return AFND.from_dict(data)
-            else:
-                raise ValueError(f"Tipo de autómata no soportado: {tipo}")
-                
+            data = ManejadorArchivos.leer_json(ruta_archivo)
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"Error al parsear JSON: {e}")
+        return ManejadorArchivos.crear_automata(data)
+    
+    @staticmethod
+    def leer_json(ruta_archivo: str) -> Dict[str, Any]:
+        """
+        Lee el contenido de un archivo JSON (con orjson si está instalado)
+        
+        Args:
+            ruta_archivo: Ruta al archivo JSON
+            
+        Returns:
+            Diccionario con los datos del archivo
+            
+        Raises:
+            json.JSONDecodeError: Si el archivo no es un JSON válido
+        """
+        if orjson is not None:
+            # orjson.JSONDecodeError es subclase de json.JSONDecodeError
+            with open(ruta_archivo, 'rb') as archivo:
+                return orjson.loads(archivo.read())
+        with open(ruta_archivo, 'r', encoding='utf-8') as archivo:
+            return json.load(archivo)
+    
+    @staticmethod
+    def crear_automata(data: Dict[str, Any]) -> Union[AFD, AFND]:
+        """
+        Crea un autómata a partir de los datos ya leídos de un archivo JSON
+        
+        Args:
+            data: Diccionario con los datos del autómata
+            
+        Returns:
+            Instancia de AFD o AFND según el tipo especificado
+            
+        Raises:
+            ValueError: Si el formato del autómata no es válido
+        """
+        # Validar estructura básica
+        ManejadorArchivos._validar_estructura_json(data)
+        
+        # Crear autómata según el tipo
+        tipo = data.get("tipo", "AFD")
+        if tipo == "AFD":
+            return AFD.from_dict(data)
+        elif tipo == "AFND":
+            return AFND.from_dict(data)
+        else:
+            raise ValueError(f"Tipo de autómata no soportado: {tipo}")
     
     @staticmethod
     def escribir_automata(automata: Union[AFD, AFND], ruta_archivo: str, 
@@ -164,8 +204,7 @@ class ManejadorArchivos:
         }
         
         try:
-            with open(ruta_archivo, 'r', encoding='utf-8') as archivo:
-                data = json.load(archivo)
+            data = ManejadorArchivos.leer_json(ruta_archivo)
             
             # Validar estructura
             ManejadorArchivos._validar_estructura_json(data)
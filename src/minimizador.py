@@ -133,6 +133,9 @@ class MinimizadorAFD:
         
         # Iterar hasta que no haya más refinamientos
         while True:
+            # Índice de la partición de cada estado: una búsqueda en diccionario por destino
+            # en lugar de recorrer todas las particiones
+            clase_de = self._indice_particiones()
             nuevas_particiones = []
             cambio = False
             # Procesar cada partición actual
@@ -147,12 +150,7 @@ class MinimizadorAFD:
                         clave = (estado, simbolo)
                         if clave in self.afd.transiciones:
                             destino = self.afd.transiciones[clave]
-                            indice_particion = None
-                            for i, particion in enumerate(self.particiones):
-                                if destino in particion:
-                                    indice_particion = i
-                                    break
-                            firma.append(indice_particion)
+                            firma.append(clase_de.get(destino))
                         else:
                             firma.append(-1)
                     firma_tupla = tuple(firma)
@@ -168,6 +166,15 @@ class MinimizadorAFD:
             self.particiones = nuevas_particiones
         return self.particiones
     
+    def _indice_particiones(self) -> Dict[str, int]:
+        """
+        Mapea cada estado al índice de la partición que lo contiene
+
+        Returns:
+            Diccionario estado -> índice en self.particiones
+        """
+        return {estado: i for i, particion in enumerate(self.particiones) for estado in particion}
+    
     def son_estados_equivalentes(self, estado1: str, estado2: str, particion: List[Set[str]]) -> bool:
         """
         Verifica si dos estados son equivalentes según una partición
@@ -265,6 +272,7 @@ class MinimizadorAFD:
                 estados_finales_minimizados.add(mapeo_particiones[i])
         
         # Construir transiciones del AFD minimizado
+        clase_de = self._indice_particiones()
         transiciones_minimizadas = {}
         for i, particion_origen in enumerate(self.particiones):
             nombre_origen = mapeo_particiones[i]
@@ -279,11 +287,7 @@ class MinimizadorAFD:
                     estado_destino = self.afd.transiciones[clave_transicion]
                     
                     # Encontrar qué partición contiene el estado destino
-                    particion_destino_idx = None
-                    for j, particion in enumerate(self.particiones):
-                        if estado_destino in particion:
-                            particion_destino_idx = j
-                            break
+                    particion_destino_idx = clase_de.get(estado_destino)
                     
                     if particion_destino_idx is not None:
                         nombre_destino = mapeo_particiones[particion_destino_idx]
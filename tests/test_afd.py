@@ -15,13 +15,15 @@ from src.afd import AFD
 class TestAFD(unittest.TestCase):
     """Tests para la clase AFD"""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Se ejecuta antes de cada test.
-        Crea AFDs de ejemplo para usar en las pruebas.
+        Se ejecuta una vez por clase.
+        Construye AFDs de ejemplo compartidos por todas las pruebas
+        (ningún test los modifica).
         """
         # AFD simple que acepta cadenas que terminan en 'b'
-        self.afd_simple = AFD(
+        cls.afd_simple = AFD(
             estados={'q0', 'q1'},
             alfabeto={'a', 'b'},
             transiciones={
@@ -35,7 +37,7 @@ class TestAFD(unittest.TestCase):
         )
         
         # AFD incompleto (le faltan transiciones)
-        self.afd_incompleto = AFD(
+        cls.afd_incompleto = AFD(
             estados={'q0', 'q1', 'q2'},
             alfabeto={'a', 'b'},
             transiciones={
@@ -48,7 +50,7 @@ class TestAFD(unittest.TestCase):
         )
         
         # AFD con estados inalcanzables
-        self.afd_con_inalcanzables = AFD(
+        cls.afd_con_inalcanzables = AFD(
             estados={'q0', 'q1', 'q2', 'q3'},  # q3 es inalcanzable
             alfabeto={'a', 'b'},
             transiciones={
@@ -95,6 +97,10 @@ class TestAFD(unittest.TestCase):
         afd_vacio = AFD(set(), set(), {}, '', set())
         self.assertTrue(afd_vacio.es_completo())  # Vacío es completo trivialmente
         print("✅ AFD vacío manejado correctamente")
+        
+        # Tantas transiciones como pares (estado, símbolo), pero una con un símbolo ajeno
+        afd_claves_ajenas = AFD({'q0'}, {'a', 'b'}, {('q0', 'a'): 'q0', ('q0', 'c'): 'q0'}, 'q0', set())
+        self.assertFalse(afd_claves_ajenas.es_completo())
     
     def test_procesar_cadena(self):
         """Test de la función procesar_cadena"""
@@ -167,6 +173,10 @@ class TestAFD(unittest.TestCase):
             self.assertIn("simbolo", trans)
             self.assertIn("destino", trans)
         
+        # Cada llamada devuelve diccionarios nuevos: modificar uno no afecta a la siguiente
+        resultado["transiciones"][0]["destino"] = 'qx'
+        self.assertNotIn('qx', [t["destino"] for t in self.afd_simple.to_dict()["transiciones"]])
+        
         print("✅ Serialización to_dict funciona correctamente")
         print(f"   Estructura generada: {list(resultado.keys())}")
     
@@ -248,6 +258,65 @@ class TestAFD(unittest.TestCase):
         self.assertIn("estados=", repr_result)
         self.assertIn("alfabeto=", repr_result)
         print(f"✅ __repr__: {repr_result}")
+    
+    def test_compilar(self):
+        """Test de la tabla compilada usada por procesar_cadena"""
+        print("\n=== Test compilar ===")
+        
+        afd = AFD({'q0', 'q1'}, {'a'}, {('q0', 'a'): 'q1', ('q0', 'b'): 'q1'}, 'q0', {'q1'})
+        
+        # Un símbolo con transición pero fuera del alfabeto se rechaza igual que antes
+        self.assertTrue(afd.procesar_cadena("a"))
+        self.assertFalse(afd.procesar_cadena("b"))
+        self.assertFalse(afd.procesar_cadena("aa"))
+        
+        # Tras modificar las transiciones en el lugar, _invalidar() descarta la tabla
+        self.assertEqual(len(afd.to_dict()["transiciones"]), 2)
+        afd.transiciones[('q1', 'a')] = 'q1'
+        afd._invalidar()
+        self.assertTrue(afd.procesar_cadena("aaa"))
+        self.assertEqual(len(afd.to_dict()["transiciones"]), 3)
+        
+        # Reasignar un atributo la descarta solo, sin llamar a compilar() ni a _invalidar()
+        afd.estados_finales = set()
+        self.assertFalse(afd.procesar_cadena("a"))
+        afd.estados_finales = {'q0'}
+        self.assertTrue(afd.procesar_cadena(""))
+        afd.estado_inicial = 'q1'
+        self.assertFalse(afd.procesar_cadena(""))
+        afd.estado_inicial = 'q0'
+        afd.estados_finales = {'q1'}
+        afd.alfabeto = {'a', 'b'}
+        self.assertTrue(afd.procesar_cadena("b"))
+        
+        # ...y al reemplazar el diccionario de transiciones
+        afd.transiciones = {('q1', 'b'): 'q1'}
+        self.assertFalse(afd.procesar_cadena("b"))
+        self.assertEqual(len(afd.to_dict()["transiciones"]), 1)
+        print("✅ Tabla compilada equivalente a la función de transición")
+    
+    def test_procesar_cadena_lote(self):
+        """Test de procesar la misma cadena con varios autómatas a la vez"""
+        print("\n=== Test procesar_cadena_lote ===")
+        
+        from src.automata import Automata
+        
+        automatas = [self.afd_simple, self.afd_incompleto, self.afd_con_inalcanzables]
+        for cadena in ["", "b", "ab", "aab", "ba", "abc", "λb"]:
+            esperado = [afd.procesar_cadena(cadena) for afd in automatas]
+            self.assertEqual(Automata().procesar_cadena_lote(cadena, automatas), esperado)
+        print("✅ Mismos resultados que procesar_cadena en cada autómata")
+    
+    def test_kind(self):
+        """Test de la etiqueta de tipo KIND"""
+        print("\n=== Test KIND ===")
+        
+        from src.afnd import AFND
+        
+        # AFD y AFND deben tener etiquetas distintas, compartidas por sus instancias
+        self.assertNotEqual(AFD.KIND, AFND.KIND)
+        self.assertEqual(self.afd_simple.KIND, AFD.KIND)
+        print("✅ KIND distingue AFD de AFND")
 
 
 def ejecutar_tests():
@@ -278,4 +347,4 @@ def ejecutar_tests():
 
 if __name__ == "__main__":
     # Ejecutar tests cuando se ejecuta el archivo directamente
-    ejecutar_tests()
+    sys.exit(0 if ejecutar_tests() else 1)
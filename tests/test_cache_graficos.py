@@ -0,0 +1,122 @@
+"""
+Tests para el caché en disco de gráficos de la interfaz
+"""
+import importlib
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+gui_minimizador = None
+
+
+class TestCacheGraficos(unittest.TestCase):
+    """Tests de _renderizar_dot_cacheado y _podar_cache_graficos"""
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Importar la interfaz recién al ejecutar estos tests: al importarse pone src/ al
+        principio del path y registra src/automata.py como 'automata', el mismo nombre que
+        el paquete de automata-lib que usan los tests comparativos. El path y el módulo
+        'automata' que hubiera se restauran después de importarla
+        """
+        global gui_minimizador
+        path, automata = list(sys.path), sys.modules.pop('automata', None)
+        try:
+            gui_minimizador = importlib.import_module('gui_minimizador')
+        except ImportError as e:
+            raise unittest.SkipTest(f"la interfaz no se puede importar: {e}")
+        finally:
+            sys.path[:] = path
+            if automata is None:
+                sys.modules.pop('automata', None)
+            else:
+                sys.modules['automata'] = automata
+
+    def setUp(self):
+        self._temporal = tempfile.TemporaryDirectory()
+        self.directorio = self._temporal.name
+
+    def tearDown(self):
+        self._temporal.cleanup()
+
+    def _crear_archivo(self, nombre, tamano, antiguedad):
+        """Crear un archivo del caché con un tamaño y una fecha de modificación dados"""
+        ruta = os.path.join(self.directorio, nombre)
+        with open(ruta, 'wb') as archivo:
+            archivo.write(b'x' * tamano)
+        fecha = time.time() - antiguedad
+        os.utime(ruta, (fecha, fecha))
+        return ruta
+
+    def test_renderizar_dot_cacheado(self):
+        """
+        Test de que un mismo código DOT se renderiza una sola vez y los distintos no se mezclan
+        """
+        with mock.patch.object(gui_minimizador, '_renderizar_dot',
+                               side_effect=lambda fuente, formato, programa: fuente.encode()) as renderizar:
+            primero = gui_minimizador._renderizar_dot_cacheado('digraph { a }', 'png', directorio=self.directorio)
+            segundo = gui_minimizador._renderizar_dot_cacheado('digraph { a }', 'png', directorio=self.directorio)
+            otro = gui_minimizador._renderizar_dot_cacheado('digraph { b }', 'png', directorio=self.directorio)
+            svg = gui_minimizador._renderizar_dot_cacheado('digraph { a }', 'svg', directorio=self.directorio)
+
+        self.assertEqual(primero, b'digraph { a }')
+        self.assertEqual(segundo, primero)
+        self.assertEqual(otro, b'digraph { b }')
+        self.assertEqual(svg, primero)
+        self.assertEqual(renderizar.call_count, 3)
+
+        # Sin temporales sueltos: un archivo por gráfico
+        archivos = sorted(os.listdir(self.directorio))
+        self.assertEqual(len(archivos), 3)
+        self.assertFalse(any(nombre.endswith('.tmp') for nombre in archivos))
+
+    def test_podar_cache_graficos(self):
+        """
+        Test de que la poda borra primero los archivos usados hace más tiempo
+        """
+        viejo = self._crear_archivo('viejo.png', 100, 300)
+        medio = self._crear_archivo('medio.png', 100, 200)
+        nuevo = self._crear_archivo('nuevo.png', 100, 100)
+
+        # Dentro del límite no se borra nada
+        gui_minimizador._podar_cache_graficos(self.directorio, 300)
+        self.assertTrue(all(os.path.exists(ruta) for ruta in (viejo, medio, nuevo)))
+
+        gui_minimizador._podar_cache_graficos(self.directorio, 250)
+        self.assertFalse(os.path.exists(viejo))
+        self.assertTrue(os.path.exists(medio))
+        self.assertTrue(os.path.exists(nuevo))
+
+    def test_podar_temporales_abandonados(self):
+        """
+        Test de que la poda borra los temporales viejos pero no los de una escritura en curso
+        """
+        abandonado = self._crear_archivo('tmpabandonado.tmp', 10, 7200)
+        en_curso = self._crear_archivo('tmpencurso.tmp', 10, 0)
+
+        gui_minimizador._podar_cache_graficos(self.directorio, 1000)
+        self.assertFalse(os.path.exists(abandonado))
+        self.assertTrue(os.path.exists(en_curso))
+
+    def test_lectura_marca_como_usado(self):
+        """
+        Test de que leer un gráfico del caché lo protege de la próxima poda
+        """
+        with mock.patch.object(gui_minimizador, '_renderizar_dot', return_value=b'x' * 100):
+            gui_minimizador._renderizar_dot_cacheado('digraph { a }', 'png', directorio=self.directorio)
+            (ruta,) = [os.path.join(self.directorio, nombre) for nombre in os.listdir(self.directorio)]
+            os.utime(ruta, (time.time() - 300, time.time() - 300))
+            otro = self._crear_archivo('otro.png', 100, 200)
+
+            gui_minimizador._renderizar_dot_cacheado('digraph { a }', 'png', directorio=self.directorio)
+        gui_minimizador._podar_cache_graficos(self.directorio, 150)
+        self.assertTrue(os.path.exists(ruta))
+        self.assertFalse(os.path.exists(otro))
+
+
+if __name__ == '__main__':
+    unittest.main()
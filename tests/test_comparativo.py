@@ -6,8 +6,9 @@ import unittest
 import sys
 import os
 
-# Agregar el directorio src al path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Agregar el directorio src al final del path: src/automata.py no debe tapar
+# al paquete automata de automata-lib
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from afd import AFD
 from afnd import AFND
@@ -26,11 +27,12 @@ except ImportError:
 class TestComparativoAutomataLib(unittest.TestCase):
     """Tests comparativos con automata-lib"""
     
-    def setUp(self):
-        """Configurar AFDs para comparar"""
+    @classmethod
+    def setUpClass(cls):
+        """Configurar AFDs para comparar (una vez por clase; ningún test los modifica)"""
         
         # AFD que acepta cadenas que terminan en 'b'
-        self.mi_afd_termina_b = AFD(
+        cls.mi_afd_termina_b = AFD(
             estados={'q0', 'q1'},
             alfabeto={'a', 'b'},
             transiciones={
@@ -44,7 +46,7 @@ class TestComparativoAutomataLib(unittest.TestCase):
         )
         
         # Mismo AFD usando automata-lib
-        self.automata_lib_termina_b = DFA(
+        cls.automata_lib_termina_b = DFA(
             states={'q0', 'q1'},
             input_symbols={'a', 'b'},
             transitions={
@@ -56,7 +58,7 @@ class TestComparativoAutomataLib(unittest.TestCase):
         )
         
         # AFD más complejo: acepta cadenas con número par de 'a's
-        self.mi_afd_par_as = AFD(
+        cls.mi_afd_par_as = AFD(
             estados={'q0', 'q1'},
             alfabeto={'a', 'b'},
             transiciones={
@@ -70,7 +72,7 @@ class TestComparativoAutomataLib(unittest.TestCase):
         )
         
         # Mismo AFD en automata-lib
-        self.automata_lib_par_as = DFA(
+        cls.automata_lib_par_as = DFA(
             states={'q0', 'q1'},
             input_symbols={'a', 'b'},
             transitions={
@@ -82,7 +84,7 @@ class TestComparativoAutomataLib(unittest.TestCase):
         )
         
         # Conjunto de cadenas de prueba
-        self.cadenas_prueba = [
+        cls.cadenas_prueba = [
             "",           # cadena vacía
             "a",          # un símbolo
             "b",
@@ -424,4 +426,4 @@ def ejecutar_tests_comparativos():
 
 
 if __name__ == "__main__":
-    ejecutar_tests_comparativos()
+    sys.exit(0 if ejecutar_tests_comparativos() else 1)
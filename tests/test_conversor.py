@@ -100,6 +100,40 @@ class TestConversorAFND(unittest.TestCase):
                 self.assertEqual(resultado_afnd, resultado_afd,
                     f"Cadena '{cadena}': AFND={resultado_afnd}, AFD={resultado_afd}")
 
+    def test_clausura_lambda_con_ciclo(self):
+        """
+        Test de clausuras lambda con un ciclo de transiciones lambda
+        """
+        afnd = AFND(
+            estados={'q0', 'q1', 'q2', 'q3'},
+            alfabeto={'a'},
+            transiciones={
+                ('q0', 'lambda'): {'q1'},
+                ('q1', 'λ'): {'q0', 'q2'},  # ciclo q0 <-> q1
+                ('q2', 'a'): {'q3'},
+            },
+            estado_inicial='q0',
+            estados_finales={'q3'}
+        )
+
+        self.assertEqual(afnd.clausura_lambda({'q1'}), {'q0', 'q1', 'q2'})
+        self.assertEqual(afnd.clausura_lambda({'q0', 'q3'}), {'q0', 'q1', 'q2', 'q3'})
+        self.assertEqual(afnd.clausura_lambda(set()), set())
+
+        # Tras modificar las transiciones en el lugar, _invalidar() descarta las clausuras
+        afnd.transiciones[('q3', '')] = {'q0'}
+        afnd._invalidar()
+        self.assertEqual(afnd.clausura_lambda({'q3'}), {'q0', 'q1', 'q2', 'q3'})
+        self.assertTrue(afnd.procesar_cadena("a"))
+
+        # ...también al modificar un conjunto de destinos; reasignar un atributo las descarta solo
+        afnd.transiciones[('q1', 'λ')].discard('q2')
+        afnd._invalidar()
+        self.assertEqual(afnd.clausura_lambda({'q0'}), {'q0', 'q1'})
+        self.assertFalse(afnd.procesar_cadena("a"))
+        afnd.estados_finales = {'q1', 'q3'}
+        self.assertTrue(afnd.procesar_cadena(""))
+
     def test_conversion_completa_automata_lib(self):
         """
         Test comparativo completo con automata-lib (solo procesamiento de cadenas)
@@ -221,6 +255,52 @@ class TestConversorAFND(unittest.TestCase):
         with self.assertRaises(ValueError):
             conversor.convertir_a_afd()
 
+    def test_destino_fuera_de_estados(self):
+        """
+        Test de procesar_cadena con una transición a un estado que no pertenece al AFND
+        """
+        afnd = AFND(
+            estados={'q0', 'q1'},
+            alfabeto={'a', 'b'},
+            transiciones={
+                ('q0', 'a'): {'q1'},
+                ('q1', 'b'): {'q9'},  # q9 no existe
+            },
+            estado_inicial='q0',
+            estados_finales={'q1'}
+        )
+
+        # Las cadenas que no usan la transición se procesan normalmente
+        self.assertTrue(afnd.procesar_cadena("a"))
+        self.assertFalse(afnd.procesar_cadena("b"))
+
+        # Usarla informa el error, también después de haberla evitado
+        with self.assertRaises(ValueError):
+            afnd.procesar_cadena("ab")
+        self.assertTrue(afnd.procesar_cadena("a"))
+
+        # Lo mismo con una transición lambda a un estado que no existe
+        afnd.transiciones[('q1', 'λ')] = {'q8'}
+        afnd._invalidar()
+        with self.assertRaises(ValueError):
+            afnd.procesar_cadena("a")
+
+    def test_conversion_destino_fuera_de_estados(self):
+        """
+        Test de convertir_a_afd con una transición a un estado que no pertenece al AFND
+        """
+        afnd = AFND(
+            estados={'q0', 'q1'},
+            alfabeto={'a'},
+            transiciones={('q0', 'a'): {'qX'}},  # qX no existe
+            estado_inicial='q0',
+            estados_finales={'q1'}
+        )
+
+        conversor = ConversorAFND(afnd)
+        with self.assertRaisesRegex(ValueError, "Estados no válidos en el AFND: {'qX'}"):
+            conversor.convertir_a_afd()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Tests para la lectura de autómatas desde archivos JSON
+"""
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src import manejador_archivos
+from src.afd import AFD
+from src.automata import Automata
+from src.manejador_archivos import ManejadorArchivos
+
+
+class TestManejadorArchivos(unittest.TestCase):
+    """Tests de la carga de archivos con y sin orjson"""
+
+    def setUp(self):
+        """
+        Escribe en un directorio temporal un AFD que acepta cadenas que terminan en 'b'
+        """
+        self._temporal = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self._temporal.name, 'termina_b.json')
+        with open(self.ruta, 'w', encoding='utf-8') as archivo:
+            json.dump({
+                "tipo": "AFD",
+                "estados": ["q0", "q1"],
+                "alfabeto": ["a", "b"],
+                "transiciones": [
+                    {"origen": "q0", "simbolo": "a", "destino": "q0"},
+                    {"origen": "q0", "simbolo": "b", "destino": "q1"},
+                    {"origen": "q1", "simbolo": "a", "destino": "q0"},
+                    {"origen": "q1", "simbolo": "b", "destino": "q1"}
+                ],
+                "estado_inicial": "q0",
+                "estados_finales": ["q1"],
+                "Lenguaje": "cadenas en {a,b} que terminan en b (ñ)"
+            }, archivo, ensure_ascii=False)
+
+    def tearDown(self):
+        self._temporal.cleanup()
+
+    def _verificar_carga(self):
+        """Cargar el archivo leyéndolo en cargar() y con los datos ya leídos"""
+        datos = ManejadorArchivos.leer_json(self.ruta)
+        self.assertEqual(datos["Lenguaje"], "cadenas en {a,b} que terminan en b (ñ)")
+
+        for automata in (Automata().cargar(self.ruta),
+                         Automata().cargar(self.ruta, datos=datos),
+                         ManejadorArchivos.crear_automata(datos)):
+            self.assertIsInstance(automata, AFD)
+            self.assertEqual(automata.estados, {'q0', 'q1'})
+            self.assertEqual(automata.alfabeto, {'a', 'b'})
+            self.assertEqual(automata.estado_inicial, 'q0')
+            self.assertEqual(automata.estados_finales, {'q1'})
+            self.assertEqual(automata.transiciones[('q0', 'b')], 'q1')
+            self.assertTrue(automata.procesar_cadena('aab'))
+            self.assertFalse(automata.procesar_cadena('ba'))
+
+    @unittest.skipIf(manejador_archivos.orjson is None, "orjson no está instalado")
+    def test_cargar_con_orjson(self):
+        """
+        Test de la carga de un archivo con orjson
+        """
+        self._verificar_carga()
+
+    def test_cargar_sin_orjson(self):
+        """
+        Test de la carga de un archivo con el módulo json de la biblioteca estándar
+        """
+        with mock.patch.object(manejador_archivos, 'orjson', None):
+            self._verificar_carga()
+
+
+if __name__ == '__main__':
+    unittest.main()